@@ -1,10 +1,78 @@
-from .organization_job_postings import *
-from .organization_search import *
-from .organization import *
-from .people_search import *
-from .people import *
-from .people_bulk import *
-from .contacts import *
-from .accounts import *
-from .labels import *
-from .usage_stats import *
\ No newline at end of file
+from .organization_job_postings import (
+    OrganizationJobPostingsQuery,
+    OrganizationJobPosting,
+    OrganizationJobPostingsResponse,
+)
+from .organization_search import (
+    OrganizationSearchQuery,
+    OrganizationSearchResponse,
+)
+from .organization import (
+    OrganizationEnrichmentQuery,
+    PrimaryPhone,
+    FundingEvent,
+    DepartmentalHeadCount,
+    CurrentTechnology,
+    IndustryTagHash,
+    OrganizationEnrichmentResponse,
+)
+from .people_search import (
+    PeopleSearchQuery,
+    Breadcrumb,
+    DialerFlags,
+    ContactEmail,
+    Account,
+    PeopleSearchResponse,
+)
+from .people import (
+    PeopleEnrichmentQuery,
+    EmploymentHistory,
+    Contact,
+    Organization,
+    PeopleEnrichmentResponse,
+    Person,
+)
+from .people_bulk import (
+    BulkPeopleEnrichmentQuery,
+    BulkPeopleEnrichmentResponse,
+)
+from .contacts import (
+    PhoneNumber,
+    ContactSearchQuery,
+    ContactCreateRequest,
+    ContactUpdateRequest,
+    ContactSearchResponse,
+    ContactCreateResponse,
+    ContactUpdateResponse,
+    ContactBulkItem,
+    ContactBulkCreateRequest,
+    ContactBulkCreateResponse,
+    ContactBulkUpdateItem,
+    ContactBulkUpdateRequest,
+    ContactBulkUpdateResponse,
+)
+from .accounts import (
+    AccountCreateRequest,
+    AccountUpdateRequest,
+    AccountSearchQuery,
+    Pagination,
+    AccountSearchResponse,
+    AccountCreateResponse,
+    AccountUpdateResponse,
+    AccountBulkItem,
+    AccountBulkCreateRequest,
+    AccountBulkCreateResponse,
+    AccountBulkUpdateItem,
+    AccountBulkUpdateRequest,
+    AccountBulkUpdateResponse,
+)
+from .labels import (
+    LabelListQuery,
+    Label,
+    LabelListResponse,
+)
+from .usage_stats import (
+    RateLimitPeriod,
+    EndpointRateLimit,
+    UsageStatsResponse,
+)
@@ -16,4 +16,4 @@ class BulkPeopleEnrichmentResponse(BaseModel):
     unique_enriched_records: Optional[int] = Field(default=0)
     missing_records: Optional[int] = Field(default=0)
     credits_consumed: Optional[int] = Field(default=0)
-    matches: Optional[List[Person]] = Field(default=None)
+    matches: Optional[List[Optional[Person]]] = Field(default=None)
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from apollo import (
+    BulkPeopleEnrichmentQuery,
+    PeopleEnrichmentQuery,
+    PeopleEnrichmentResponse,
+)
+
+# Query fields that apply to a whole bulk_match request rather than one person
+_BULK_OPTIONS = ("reveal_personal_emails", "reveal_phone_number", "webhook_url")
+
+
+class ApolloBatcher:
+    """
+    Coalesce concurrent single-person enrichments into bulk_match requests.
+
+    Calls arriving within `window` seconds of each other (or until `max_batch`
+    have queued) share one HTTP round-trip. Only queries with the same reveal
+    options and webhook_url are grouped, since those apply to the whole request.
+    """
+
+    def __init__(self, client, max_batch: int = 10, window: float = 0.015):
+        self.client = client
+        self.max_batch = max_batch
+        self.window = window
+        self._pending: Dict[tuple, List[Tuple[PeopleEnrichmentQuery, asyncio.Future]]] = {}
+        self._timers: Dict[tuple, asyncio.TimerHandle] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def people_enrichment(self, query: PeopleEnrichmentQuery) -> Optional[PeopleEnrichmentResponse]:
+        """Queue one enrichment and wait for the batch it lands in to complete."""
+        loop = asyncio.get_running_loop()
+        key = tuple(getattr(query, option) for option in _BULK_OPTIONS)
+        future = loop.create_future()
+
+        batch = self._pending.setdefault(key, [])
+        batch.append((query, future))
+        if len(batch) >= self.max_batch:
+            self._flush_key(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush_key, key)
+        return await future
+
+    async def flush(self) -> None:
+        """Send every queued batch now and wait for all in-flight batches."""
+        for key in list(self._pending):
+            self._flush_key(key)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _flush_key(self, key: tuple) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: List[Tuple[PeopleEnrichmentQuery, asyncio.Future]]) -> None:
+        try:
+            results = await self._enrich(batch)
+        except Exception as e:
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _enrich(self, batch: List[Tuple[PeopleEnrichmentQuery, asyncio.Future]]) -> List[Union[Optional[PeopleEnrichmentResponse], Exception]]:
+        queries = [query for query, _ in batch]
+        if len(queries) == 1:
+            return [await self.client.people_enrichment(queries[0])]
+
+        options = {option: getattr(queries[0], option) for option in _BULK_OPTIONS}
+        bulk_query = BulkPeopleEnrichmentQuery(
+            **options,
+            details=[query.model_dump(exclude=set(_BULK_OPTIONS), exclude_none=True) for query in queries]
+        )
+        try:
+            response = await self.client.people_bulk_enrichment(bulk_query)
+        except Exception:
+            response = None
+
+        # bulk_match returns one match (or null) per detail, in request order.
+        # If it failed or came back short, enrich each query on its own so one
+        # bad detail only fails its own caller.
+        if response is None or len(response.matches or []) != len(queries):
+            return await asyncio.gather(
+                *(self.client.people_enrichment(query) for query in queries),
+                return_exceptions=True
+            )
+        return [PeopleEnrichmentResponse(person=person) for person in response.matches]
@@ -1,10 +1,144 @@
-from typing import Optional, List, Dict
+from collections import OrderedDict
+from typing import Any, Optional, List, Dict, Union, AsyncIterator, Awaitable, Callable
+import asyncio
+import functools
+import json
+import logging
+import os
+import time
 import httpx
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional, see the "speedups" extra
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:  # optional, see the "speedups" extra
+    HTTP2_AVAILABLE = False
+
+from apollo import (
+    PeopleEnrichmentQuery,
+    PeopleEnrichmentResponse,
+    BulkPeopleEnrichmentQuery,
+    BulkPeopleEnrichmentResponse,
+    PeopleSearchQuery,
+    PeopleSearchResponse,
+    OrganizationEnrichmentQuery,
+    OrganizationEnrichmentResponse,
+    OrganizationSearchQuery,
+    OrganizationSearchResponse,
+    OrganizationJobPostingsResponse,
+    ContactSearchResponse,
+    ContactCreateResponse,
+    ContactUpdateResponse,
+    ContactBulkCreateResponse,
+    ContactBulkUpdateResponse,
+    AccountSearchResponse,
+    AccountCreateResponse,
+    AccountUpdateResponse,
+    AccountBulkCreateResponse,
+    AccountBulkUpdateResponse,
+    UsageStatsResponse,
+    Label,
+    LabelListResponse,
+)
+from apollo_batcher import ApolloBatcher
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(payload) -> bytes:
+    """Encode a request body as JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _loads(content: bytes):
+    """Decode a JSON response body (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _cache_key(name: str, args: tuple, kwargs: dict) -> bytes:
+    """
+    Canonical JSON encoding of a method call, used as its cache key.
+
+    Models are dumped and dicts key-sorted. The key is the full payload rather
+    than a digest of it, so different calls can never share an entry.
+    """
+    def encode(value):
+        if isinstance(value, BaseModel):
+            return value.model_dump(exclude_none=True)
+        return str(value)
+
+    call = [name, args, kwargs]
+    if orjson is not None:
+        return orjson.dumps(call, default=encode, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(call, sort_keys=True, default=encode).encode()
+
+
+# Write payload fields that set list membership (and can create labels)
+_LABEL_FIELDS = ("label_names", "label_ids")
+
+
+def ttl_cache(ttl: float, maxsize: int = 1024):
+    """
+    Cache successful results of an ApolloClient coroutine method for `ttl` seconds.
+
+    Entries live on the client instance, keyed by (method name, call hash), and
+    are evicted least-recently-used once `maxsize` is exceeded. None results
+    (API errors) are never cached.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            cache = self._response_cache
+            key = (fn.__name__, _cache_key(fn.__name__, args, kwargs))
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                cache.move_to_end(key)
+                return entry[1]
+
+            result = await fn(self, *args, **kwargs)
+            if result is not None:
+                cache[key] = (time.monotonic() + ttl, result)
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+
+def coalesce(fn):
+    """
+    Share one in-flight call among concurrent identical calls of an ApolloClient
+    coroutine method, so duplicate queries cost a single HTTP request.
+
+    Every caller gets the same result (or exception). The shared call is shielded,
+    so one caller being cancelled doesn't cancel it for the others.
+    """
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        in_flight = self._in_flight
+        key = _cache_key(fn.__name__, args, kwargs)
+        future = in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn(self, *args, **kwargs))
+            in_flight[key] = future
+            future.add_done_callback(lambda _: in_flight.pop(key, None))
+        return await asyncio.shield(future)
+    return wrapper
 
-from apollo import *
 
 class ApolloClient:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, pool_size: Optional[int] = None):
         self.api_key = api_key
         self.base_url = "https://api.apollo.io/api/v1"
         self.headers = {
@@ -13,6 +147,76 @@ class ApolloClient:
             "Content-Type": "application/json",
             "x-api-key": self.api_key,
         }
+        # Concurrent tool calls each hold a connection; size the pool so they
+        # don't queue on acquisition (override with pool_size or APOLLO_POOL_SIZE)
+        if pool_size is None:
+            pool_size = int(os.getenv("APOLLO_POOL_SIZE", "100"))
+
+        # One pooled client per ApolloClient so keepalive connections (and their
+        # TCP/TLS handshakes) are reused across tool calls instead of per request.
+        # With h2 installed, concurrent calls are multiplexed over one connection.
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=HTTP2_AVAILABLE,
+            # Skip the key header when unset so the server can still start without one
+            headers={k: v for k, v in self.headers.items() if v is not None},
+            timeout=30,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=30,
+            ),
+        )
+
+        # Cap in-flight bulk requests so callers fanning out many bulk calls
+        # don't trip Apollo's per-minute limits (override with APOLLO_BULK_CONCURRENCY)
+        self._bulk_sem = asyncio.Semaphore(int(os.getenv("APOLLO_BULK_CONCURRENCY", "8")))
+
+        # Responses of slow-changing read endpoints, see ttl_cache
+        self._response_cache: OrderedDict = OrderedDict()
+
+        # Pending read calls shared by identical concurrent callers, see coalesce
+        self._in_flight: Dict[Any, asyncio.Future] = {}
+
+        # Coalesces concurrent people_enrichment calls into bulk_match requests
+        self.batcher = ApolloBatcher(self)
+
+    async def aclose(self) -> None:
+        """Send any queued batched enrichments, then close the HTTP connection pool."""
+        await self.batcher.flush()
+        await self._http.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether aclose() has shut the HTTP connection pool."""
+        return self._http.is_closed
+
+    async def warmup(self) -> None:
+        """
+        Open a pooled connection to Apollo (DNS + TCP + TLS) ahead of the first
+        tool call. Sends a HEAD to the API base, which costs no credits; the
+        response or any error is ignored since only the connection is wanted.
+        """
+        try:
+            await self._http.head(self.base_url)
+        except httpx.HTTPError:
+            pass
+
+    def clear_cache(self) -> None:
+        """Drop all cached read responses (usage stats, labels, enrichments)."""
+        self._response_cache.clear()
+
+    def _forget_labels(self, *records: Dict) -> None:
+        """
+        Drop cached labels_list results after a write that sets list membership.
+
+        Apollo creates labels named in label_names on the fly, so a cached list
+        would miss them until the TTL ran out.
+        """
+        if not any(record.get(field) for record in records for field in _LABEL_FIELDS):
+            return
+        for key in [key for key in self._response_cache if key[0] == "labels_list"]:
+            del self._response_cache[key]
 
     async def people_enrichment(self, query: PeopleEnrichmentQuery) -> Optional[PeopleEnrichmentResponse]:
         """
@@ -20,13 +224,12 @@ class ApolloClient:
         https://docs.apollo.io/reference/people-enrichment
         """
         url = f"{self.base_url}/people/match"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=query.model_dump(), headers=self.headers)
-            if response.status_code == 200:
-                return PeopleEnrichmentResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.post(url, content=_dumps(query.model_dump()))
+        if response.status_code == 200:
+            return PeopleEnrichmentResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def people_bulk_enrichment(self, query: BulkPeopleEnrichmentQuery) -> Optional[BulkPeopleEnrichmentResponse]:
         """
@@ -34,70 +237,214 @@ class ApolloClient:
         https://docs.apollo.io/reference/bulk-people-enrichment
         """
         url = f"{self.base_url}/people/bulk_match"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=query.model_dump(), headers=self.headers)
-            if response.status_code == 200:
-                return BulkPeopleEnrichmentResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
-
+        async with self._bulk_sem:
+            response = await self._http.post(url, content=_dumps(query.model_dump()))
+        if response.status_code == 200:
+            return BulkPeopleEnrichmentResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
+
+    async def people_bulk_enrichment_stream(
+        self,
+        query: BulkPeopleEnrichmentQuery,
+        chunk_size: int = 10
+    ) -> AsyncIterator[Any]:
+        """
+        Split query.details into bulk_match calls of chunk_size, issue them
+        concurrently, and yield (shard_query, response) pairs as each completes.
+
+        response is None for a failed shard, whether Apollo returned an error
+        or the request raised an httpx error, so one shard can't discard the
+        others. In-flight
+        shards are capped by APOLLO_BULK_CONCURRENCY; shards still pending are
+        cancelled if the consumer stops iterating early.
+        """
+        async def run(shard: BulkPeopleEnrichmentQuery):
+            try:
+                return shard, await self.people_bulk_enrichment(shard)
+            except httpx.HTTPError as e:
+                # Logged, not printed: stdout carries the MCP stdio protocol
+                logger.warning("Bulk enrichment shard failed: %r", e)
+                return shard, None
+
+        tasks = [
+            asyncio.ensure_future(run(query.model_copy(update={"details": query.details[i:i + chunk_size]})))
+            for i in range(0, len(query.details), chunk_size)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def people_bulk_enrichment_many(
+        self,
+        query: BulkPeopleEnrichmentQuery,
+        chunk_size: int = 10
+    ) -> Optional[BulkPeopleEnrichmentResponse]:
+        """
+        Enrich any number of people via people_bulk_enrichment_stream and merge
+        the shard responses as they arrive.
+
+        Failed shards are retried once, together, after the first pass. Counts
+        and credits_consumed are summed across shards, matches are
+        de-duplicated by person id (in shard completion order) and
+        unique_enriched_records counts them, and people in shards that fail
+        twice are counted as missing_records. Returns None only if every shard
+        fails.
+        """
+        merged = BulkPeopleEnrichmentResponse(matches=[])
+        succeeded = False
+        seen_ids = set()
+
+        async def merge_shards(shards_query):
+            nonlocal succeeded
+            failed = []
+            async for shard, result in self.people_bulk_enrichment_stream(shards_query, chunk_size):
+                if result is None:
+                    failed.append(shard)
+                    continue
+                succeeded = True
+                merged.status = merged.status or result.status
+                merged.total_requested_enrichments += result.total_requested_enrichments or 0
+                merged.missing_records += result.missing_records or 0
+                merged.credits_consumed += result.credits_consumed or 0
+                for person in result.matches or []:
+                    if person is not None and person.id not in seen_ids:
+                        seen_ids.add(person.id)
+                        merged.matches.append(person)
+            return [detail for shard in failed for detail in shard.details]
+
+        failed_details = await merge_shards(query)
+        if failed_details:
+            failed_details = await merge_shards(query.model_copy(update={"details": failed_details}))
+
+        if not succeeded:
+            return None
+        merged.unique_enriched_records = len(merged.matches)
+        merged.total_requested_enrichments += len(failed_details)
+        merged.missing_records += len(failed_details)
+        return merged
+
+    @ttl_cache(ttl=3600)
+    @coalesce
     async def organization_enrichment(self, query: OrganizationEnrichmentQuery) -> Optional[OrganizationEnrichmentResponse]:
         """
         Use the Organization Enrichment endpoint to enrich data for 1 company.
+        Responses are cached for 1 hour.
         https://docs.apollo.io/reference/organization-enrichment
         """
         url = f"{self.base_url}/organizations/enrich"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=query.model_dump(), headers=self.headers)
-            if response.status_code == 200:
-                return OrganizationEnrichmentResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
-
-    async def people_search(self, query: PeopleSearchQuery) -> Optional[PeopleSearchResponse]:
+        response = await self._http.get(url, params=query.model_dump())
+        if response.status_code == 200:
+            return OrganizationEnrichmentResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
+
+    @coalesce
+    async def people_search(self, query: PeopleSearchQuery, raw: bool = False) -> Optional[Union[Dict, PeopleSearchResponse]]:
         """
         Use the People Search endpoint to find people.
         https://docs.apollo.io/reference/people-search
+
+        Pass raw=True to get the decoded JSON dict without building the response model.
         """
         url = f"{self.base_url}/mixed_people/search"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=query.model_dump(), headers=self.headers)
-            if response.status_code == 200:
-                return PeopleSearchResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
-
-    async def organization_search(self, query: OrganizationSearchQuery) -> Optional[OrganizationSearchResponse]:
+        response = await self._http.post(url, content=_dumps(query.model_dump()))
+        if response.status_code == 200:
+            data = _loads(response.content)
+            return data if raw else PeopleSearchResponse(**data)
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
+
+    @coalesce
+    async def organization_search(self, query: OrganizationSearchQuery, raw: bool = False) -> Optional[Union[Dict, OrganizationSearchResponse]]:
         """
         Use the Organization Search endpoint to find organizations.
         https://docs.apollo.io/reference/organization-search
+
+        Pass raw=True to get the decoded JSON dict without building the response model.
         """
         url = f"{self.base_url}/mixed_companies/search"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=query.model_dump(), headers=self.headers)
-            if response.status_code == 200:
-                return OrganizationSearchResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.post(url, content=_dumps(query.model_dump()))
+        if response.status_code == 200:
+            data = _loads(response.content)
+            return data if raw else OrganizationSearchResponse(**data)
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[Optional[BaseModel]]],
+        items_attr: str,
+        start_page: int = 1
+    ) -> AsyncIterator[Any]:
+        """
+        Yield records page-by-page from a paginated search endpoint.
+
+        Stops on an error, a short page, or once pagination.total_pages is reached,
+        so only one page of results is held in memory at a time.
+        """
+        page = start_page
+        while True:
+            result = await fetch_page(page)
+            if result is None:
+                return
+            items = getattr(result, items_attr) or []
+            pagination = result.pagination
+            for item in items:
+                yield item
+            if not items or pagination is None:
+                return
+            if page >= pagination.total_pages or len(items) < pagination.per_page:
+                return
+            # Drop the page before fetching the next so it can be collected
+            result = items = None
+            page += 1
+
+    def people_search_stream(self, query: PeopleSearchQuery) -> AsyncIterator[Any]:
+        """
+        Iterate over all People Search results, fetching one page at a time.
+
+        Usage:
+            async for person in client.people_search_stream(query):
+                ...
+        """
+        async def fetch_page(page: int) -> Optional[PeopleSearchResponse]:
+            return await self.people_search(query.model_copy(update={"page": page}))
+
+        return self._iter_pages(fetch_page, "people", start_page=query.page or 1)
+
+    def organization_search_stream(self, query: OrganizationSearchQuery) -> AsyncIterator[Any]:
+        """Iterate over all Organization Search results, fetching one page at a time."""
+        async def fetch_page(page: int) -> Optional[OrganizationSearchResponse]:
+            return await self.organization_search(query.model_copy(update={"page": page}))
+
+        return self._iter_pages(fetch_page, "organizations", start_page=query.page or 1)
 
-    async def organization_job_postings(self, organization_id: str) -> Optional[OrganizationJobPostingsResponse]:
+    @coalesce
+    async def organization_job_postings(self, organization_id: str, raw: bool = False) -> Optional[Union[Dict, OrganizationJobPostingsResponse]]:
         """
         Use the Organization Job Postings endpoint to find job postings for a specific organization.
         https://docs.apollo.io/reference/organization-jobs-postings
+
+        Pass raw=True to get the decoded JSON dict without building the response model.
         """
         url = f"{self.base_url}/organizations/{organization_id}/job_postings"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            if response.status_code == 200:
-                return OrganizationJobPostingsResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
-
+        response = await self._http.get(url)
+        if response.status_code == 200:
+            data = _loads(response.content)
+            return data if raw else OrganizationJobPostingsResponse(**data)
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
+
+    @coalesce
     async def contact_search(
         self,
         query: Optional[str] = None,
@@ -128,13 +475,24 @@ class ApolloClient:
         if label_ids:
             params["contact_label_ids[]"] = label_ids
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=self.headers)
-            if response.status_code == 200:
-                return ContactSearchResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.get(url, params=params)
+        if response.status_code == 200:
+            return ContactSearchResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
+
+    def contact_search_stream(
+        self,
+        query: Optional[str] = None,
+        label_ids: Optional[List[str]] = None,
+        per_page: int = 100
+    ) -> AsyncIterator[Any]:
+        """Iterate over all matching CRM contacts, fetching one page at a time."""
+        async def fetch_page(page: int) -> Optional[ContactSearchResponse]:
+            return await self.contact_search(query=query, label_ids=label_ids, page=page, per_page=per_page)
+
+        return self._iter_pages(fetch_page, "contacts")
 
     async def contact_create(
         self,
@@ -165,30 +523,24 @@ class ApolloClient:
             ContactCreateResponse with created contact including contact_id
         """
         url = f"{self.base_url}/contacts"
-        data = {
-            "first_name": first_name,
-            "last_name": last_name
-        }
-        if email:
-            data["email"] = email
-        if organization_name:
-            data["organization_name"] = organization_name
-        if title:
-            data["title"] = title
-        if label_names:
-            data["label_names"] = label_names
-        if phone_numbers:
-            data["phone_numbers"] = phone_numbers
+        optional = (
+            ("email", email),
+            ("organization_name", organization_name),
+            ("title", title),
+            ("label_names", label_names),
+            ("phone_numbers", phone_numbers),
+        )
+        data = {"first_name": first_name, "last_name": last_name, **{k: v for k, v in optional if v}}
         # Add any additional fields
         data.update(kwargs)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data, headers=self.headers)
-            if response.status_code == 200:
-                return ContactCreateResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.post(url, content=_dumps(data))
+        self._forget_labels(data)
+        if response.status_code == 200:
+            return ContactCreateResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def contact_update(
         self,
@@ -218,13 +570,13 @@ class ApolloClient:
         # Filter out None values to only update provided fields
         data = {k: v for k, v in fields.items() if v is not None}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, json=data, headers=self.headers)
-            if response.status_code == 200:
-                return ContactUpdateResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.put(url, content=_dumps(data))
+        self._forget_labels(data)
+        if response.status_code == 200:
+            return ContactUpdateResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def contact_get(
         self,
@@ -243,14 +595,13 @@ class ApolloClient:
         """
         url = f"{self.base_url}/contacts/{contact_id}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            if response.status_code == 200:
-                # API returns {"contact": {...}}
-                return response.json().get("contact")
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.get(url)
+        if response.status_code == 200:
+            # API returns {"contact": {...}}
+            return _loads(response.content).get("contact")
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def contact_bulk_create(
         self,
@@ -277,23 +628,24 @@ class ApolloClient:
         url = f"{self.base_url}/contacts/bulk_create"
         data = {"contacts": contacts[:100]}  # Cap at 100 per API docs
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data, headers=self.headers)
-            if response.status_code == 200:
-                result = ContactBulkCreateResponse(**response.json())
-
-                # Seed the label cache for created contacts
-                for i, contact_dict in enumerate(contacts[:100]):
-                    if 'label_names' in contact_dict and i < len(result.created_contacts):
-                        created_contact = result.created_contacts[i]
-                        contact_id = created_contact.get('id') if isinstance(created_contact, dict) else getattr(created_contact, 'id', None)
-                        if contact_id:
-                            self._contact_labels_cache[contact_id] = contact_dict['label_names']
-
-                return result
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        async with self._bulk_sem:
+            response = await self._http.post(url, content=_dumps(data))
+        self._forget_labels(*data["contacts"])
+        if response.status_code == 200:
+            result = ContactBulkCreateResponse(**_loads(response.content))
+
+            # Seed the label cache for created contacts
+            for i, contact_dict in enumerate(contacts[:100]):
+                if 'label_names' in contact_dict and i < len(result.created_contacts):
+                    created_contact = result.created_contacts[i]
+                    contact_id = created_contact.get('id') if isinstance(created_contact, dict) else getattr(created_contact, 'id', None)
+                    if contact_id:
+                        self._contact_labels_cache[contact_id] = contact_dict['label_names']
+
+            return result
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def contact_bulk_update(
         self,
@@ -318,14 +670,16 @@ class ApolloClient:
         url = f"{self.base_url}/contacts/bulk_update"
         data = {"contacts": contacts[:100]}  # Cap at 100 per API docs
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data, headers=self.headers)
-            if response.status_code == 200:
-                return ContactBulkUpdateResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        async with self._bulk_sem:
+            response = await self._http.post(url, content=_dumps(data))
+        self._forget_labels(*data["contacts"])
+        if response.status_code == 200:
+            return ContactBulkUpdateResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
+    @coalesce
     async def account_search(
         self,
         query: Optional[str] = None,
@@ -356,13 +710,24 @@ class ApolloClient:
         if label_ids:
             params["account_label_ids[]"] = label_ids
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=self.headers)
-            if response.status_code == 200:
-                return AccountSearchResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.get(url, params=params)
+        if response.status_code == 200:
+            return AccountSearchResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
+
+    def account_search_stream(
+        self,
+        query: Optional[str] = None,
+        label_ids: Optional[List[str]] = None,
+        per_page: int = 100
+    ) -> AsyncIterator[Any]:
+        """Iterate over all matching CRM accounts, fetching one page at a time."""
+        async def fetch_page(page: int) -> Optional[AccountSearchResponse]:
+            return await self.account_search(query=query, label_ids=label_ids, page=page, per_page=per_page)
+
+        return self._iter_pages(fetch_page, "accounts")
 
     async def account_create(
         self,
@@ -395,30 +760,24 @@ class ApolloClient:
             AccountCreateResponse with created account including account_id
         """
         url = f"{self.base_url}/accounts"
-        data = {"name": name}
-
-        if domain:
-            data["domain"] = domain
-        if owner_id:
-            data["owner_id"] = owner_id
-        if account_stage_id:
-            data["account_stage_id"] = account_stage_id
-        if phone:
-            data["phone"] = phone
-        if raw_address:
-            data["raw_address"] = raw_address
-        if typed_custom_fields:
-            data["typed_custom_fields"] = typed_custom_fields
-        if label_names:
-            data["label_names"] = label_names
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data, headers=self.headers)
-            if response.status_code == 200:
-                return AccountCreateResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        optional = (
+            ("domain", domain),
+            ("owner_id", owner_id),
+            ("account_stage_id", account_stage_id),
+            ("phone", phone),
+            ("raw_address", raw_address),
+            ("typed_custom_fields", typed_custom_fields),
+            ("label_names", label_names),
+        )
+        data = {"name": name, **{k: v for k, v in optional if v}}
+
+        response = await self._http.post(url, content=_dumps(data))
+        self._forget_labels(data)
+        if response.status_code == 200:
+            return AccountCreateResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def account_get(
         self,
@@ -437,14 +796,13 @@ class ApolloClient:
         """
         url = f"{self.base_url}/accounts/{account_id}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            if response.status_code == 200:
-                # API returns {"account": {...}}
-                return response.json().get("account")
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.get(url)
+        if response.status_code == 200:
+            # API returns {"account": {...}}
+            return _loads(response.content).get("account")
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def account_update(
         self,
@@ -473,13 +831,13 @@ class ApolloClient:
         # Filter out None values to only update provided fields
         data = {k: v for k, v in fields.items() if v is not None}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(url, json=data, headers=self.headers)
-            if response.status_code == 200:
-                return AccountUpdateResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.patch(url, content=_dumps(data))
+        self._forget_labels(data)
+        if response.status_code == 200:
+            return AccountUpdateResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def account_bulk_create(
         self,
@@ -500,23 +858,24 @@ class ApolloClient:
         url = f"{self.base_url}/accounts/bulk_create"
         data = {"accounts": accounts[:100]}  # Cap at 100 per API docs
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data, headers=self.headers)
-            if response.status_code == 200:
-                result = AccountBulkCreateResponse(**response.json())
-
-                # Seed the label cache for created accounts
-                for i, account_dict in enumerate(accounts[:100]):
-                    if 'label_names' in account_dict and i < len(result.created_accounts):
-                        created_account = result.created_accounts[i]
-                        account_id = created_account.get('id') if isinstance(created_account, dict) else getattr(created_account, 'id', None)
-                        if account_id:
-                            self._account_labels_cache[account_id] = account_dict['label_names']
-
-                return result
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        async with self._bulk_sem:
+            response = await self._http.post(url, content=_dumps(data))
+        self._forget_labels(*data["accounts"])
+        if response.status_code == 200:
+            result = AccountBulkCreateResponse(**_loads(response.content))
+
+            # Seed the label cache for created accounts
+            for i, account_dict in enumerate(accounts[:100]):
+                if 'label_names' in account_dict and i < len(result.created_accounts):
+                    created_account = result.created_accounts[i]
+                    account_id = created_account.get('id') if isinstance(created_account, dict) else getattr(created_account, 'id', None)
+                    if account_id:
+                        self._account_labels_cache[account_id] = account_dict['label_names']
+
+            return result
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     async def account_bulk_update(
         self,
@@ -537,20 +896,25 @@ class ApolloClient:
         url = f"{self.base_url}/accounts/bulk_update"
         data = {"accounts": accounts[:100]}  # Cap at 100 per API docs
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data, headers=self.headers)
-            if response.status_code == 200:
-                return AccountBulkUpdateResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
-
-    async def usage_stats(self) -> Optional[UsageStatsResponse]:
+        async with self._bulk_sem:
+            response = await self._http.post(url, content=_dumps(data))
+        self._forget_labels(*data["accounts"])
+        if response.status_code == 200:
+            return AccountBulkUpdateResponse(**_loads(response.content))
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
+
+    @ttl_cache(ttl=30)
+    @coalesce
+    async def usage_stats(self, raw: bool = False) -> Optional[Union[Dict, UsageStatsResponse]]:
         """
         Get API usage statistics and rate limits for your Apollo account.
         https://docs.apollo.io/reference/get-usage-stats
 
         Returns rate limits per endpoint with minute, hour, and day limits.
+        Responses are cached for 30 seconds.
+        Pass raw=True to get the decoded JSON dict without building the response model.
 
         Returns:
             UsageStatsResponse with rate limit stats keyed by endpoint identifier
@@ -560,28 +924,33 @@ class ApolloClient:
         """
         url = f"{self.base_url}/usage_stats/api_usage_stats"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers)
-            if response.status_code == 200:
-                return UsageStatsResponse(**response.json())
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.post(url)
+        if response.status_code == 200:
+            data = _loads(response.content)
+            return data if raw else UsageStatsResponse(**data)
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
+    @ttl_cache(ttl=300)
+    @coalesce
     async def labels_list(
         self,
-        modality: Optional[str] = None
-    ) -> Optional[LabelListResponse]:
+        modality: Optional[str] = None,
+        raw: bool = False
+    ) -> Optional[Union[Dict, LabelListResponse]]:
         """
         List all labels/lists in your Apollo account.
         https://docs.apollo.io/reference/get-a-list-of-all-lists
 
         The API returns all labels across all modalities (contacts, accounts, emailer_campaigns).
         Client-side filtering by modality is performed if specified.
+        Responses are cached for 5 minutes (see clear_cache).
 
         Args:
             modality: Filter by modality ("contacts", "accounts", "emailer_campaigns").
                      If None, returns all labels.
+            raw: Return {"labels": [...]} as plain dicts without building models
 
         Returns:
             LabelListResponse with list of labels
@@ -591,18 +960,19 @@ class ApolloClient:
         """
         url = f"{self.base_url}/labels"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            if response.status_code == 200:
-                labels_data = response.json()
-                # API returns array directly, wrap in LabelListResponse
-                # Filter by modality if specified
-                if modality:
-                    labels_data = [label for label in labels_data if label.get('modality') == modality]
-                return LabelListResponse(labels=[Label(**label) for label in labels_data])
-            else:
-                print(f"Error: {response.status_code} - {response.text}")
-                return None
+        response = await self._http.get(url)
+        if response.status_code == 200:
+            labels_data = _loads(response.content)
+            # API returns array directly, wrap in LabelListResponse
+            # Filter by modality if specified
+            if modality:
+                labels_data = [label for label in labels_data if label.get('modality') == modality]
+            if raw:
+                return {"labels": labels_data}
+            return LabelListResponse(labels=[Label(**label) for label in labels_data])
+        else:
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
 
     # Cache for account labels (since API doesn't reliably return label_names)
     _account_labels_cache: Dict[str, List[str]] = {}
@@ -873,5 +1243,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
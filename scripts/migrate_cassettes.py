@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Convert recorded YAML VCR cassettes to the JSON cassettes the tests replay.
+
+The integration tests used to record `<name>.yaml` cassettes; they now read
+`<name>.json`. Run this once to keep existing recordings instead of calling
+the API again. YAML files that already have a JSON twin are left alone.
+
+Usage:
+    python scripts/migrate_cassettes.py [cassette_dir]
+"""
+
+import sys
+from pathlib import Path
+
+from vcr.serialize import deserialize, serialize
+from vcr.serializers import jsonserializer, yamlserializer
+
+DEFAULT_CASSETTE_DIR = Path(".scratch/http-tests")
+
+
+def migrate_cassette(yaml_path: Path) -> Path:
+    """Rewrite one YAML cassette as JSON next to it and return the new path."""
+    requests, responses = deserialize(yaml_path.read_text(), yamlserializer)
+    json_path = yaml_path.with_suffix(".json")
+    json_path.write_text(serialize({"requests": requests, "responses": responses}, jsonserializer))
+    return json_path
+
+
+def main():
+    cassette_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CASSETTE_DIR
+    if not cassette_dir.is_dir():
+        print(f"No cassette directory at {cassette_dir}")
+        return
+
+    migrated = 0
+    for yaml_path in sorted(cassette_dir.glob("*.yaml")):
+        if yaml_path.with_suffix(".json").exists():
+            continue
+        print(f"{yaml_path.name} -> {migrate_cassette(yaml_path).name}")
+        migrated += 1
+    print(f"Migrated {migrated} cassette(s)")
+
+
+if __name__ == "__main__":
+    main()
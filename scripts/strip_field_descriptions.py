@@ -7,30 +7,31 @@ These descriptions get serialized into JSON schemas sent to Claude.
 import re
 from pathlib import Path
 
+# Compiled once at import; strip_descriptions runs these per Field() match
+_FIELD_RE = re.compile(r'Field\((.*?)\)', re.DOTALL)
+# Match: description="..." / '...' / """...""" / '''...''' (multi-line)
+_DESC_RE = re.compile(
+    r',?\s*description\s*=\s*(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"[^"]*"|\'[^\']*\')',
+    re.DOTALL
+)
+_TRAIL_COMMA_RE = re.compile(r',\s*\)')
+_LEAD_COMMA_RE = re.compile(r'\(\s*,')
+
+
 def strip_descriptions(content: str) -> str:
     """
     Remove description= arguments from Field() calls.
     Keep default= and other arguments.
     """
-    # Pattern to match Field(..., description="...", ...)
-    # This handles multi-line descriptions too
-    pattern = r'Field\((.*?)\)'
-
     def replace_field(match):
         field_content = match.group(1)
 
         # Remove description parameter (handles multi-line)
-        # Match: description="..." or description='...'
-        field_content = re.sub(
-            r',?\s*description\s*=\s*["\'].*?["\']',
-            '',
-            field_content,
-            flags=re.DOTALL
-        )
+        field_content = _DESC_RE.sub('', field_content)
 
         # Clean up any trailing commas or extra whitespace
-        field_content = re.sub(r',\s*\)', ')', field_content)
-        field_content = re.sub(r'\(\s*,', '(', field_content)
+        field_content = _TRAIL_COMMA_RE.sub(')', field_content)
+        field_content = _LEAD_COMMA_RE.sub('(', field_content)
         field_content = field_content.strip()
 
         # If Field now has no arguments, just use Field()
@@ -40,7 +41,7 @@ def strip_descriptions(content: str) -> str:
         return f'Field({field_content})'
 
     # Apply the replacement
-    result = re.sub(pattern, replace_field, content, flags=re.DOTALL)
+    result = _FIELD_RE.sub(replace_field, content)
 
     return result
 
@@ -1,29 +1,104 @@
+from __future__ import annotations
+
 from mcp.server.fastmcp import FastMCP
 from apollo_client import ApolloClient
+import argparse
+import asyncio
+import atexit
+import functools
+import importlib
+import json
+import logging
 import os
 import sys
+import anyio
 import typer
-from typing import Optional
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import FrozenSet, Optional, Tuple
 
 from dotenv import load_dotenv
-load_dotenv()
-# Also load .env.secrets if present
-load_dotenv('.env.secrets')
+
+logger = logging.getLogger(__name__)
+
+
+def load_env() -> None:
+    """
+    Load .env and .env.secrets once per process.
+
+    The sentinel lives in os.environ so re-imports of this module (e.g. by
+    `mcp run`) and child processes skip the filesystem scan. The files are
+    also skipped when an API key is already in the environment (containers,
+    CI) unless APOLLO_DOTENV=1 is set.
+    """
+    if os.environ.get("_APOLLO_ENV_LOADED"):
+        return
+    has_key = os.environ.get("APOLLO_IO_API_KEY") or os.environ.get("APOLLO_API_KEY")
+    if has_key and os.environ.get("APOLLO_DOTENV") != "1":
+        return
+    load_dotenv()
+    # Also load .env.secrets if present
+    load_dotenv('.env.secrets')
+    os.environ["_APOLLO_ENV_LOADED"] = "1"
+
+
+load_env()
+
+
+def get_api_key() -> Optional[str]:
+    """Read the Apollo API key, preferring APOLLO_IO_API_KEY over APOLLO_API_KEY."""
+    return os.getenv("APOLLO_IO_API_KEY") or os.getenv("APOLLO_API_KEY")
+
+
+_apollo_client: Optional[ApolloClient] = None
+
+
+def get_apollo_client() -> ApolloClient:
+    """
+    Return the process-wide ApolloClient, creating it on first use.
+
+    The Typer command and the `mcp run` import path share it, so only one HTTP
+    connection pool is ever open.
+    """
+    global _apollo_client
+    if _apollo_client is None:
+        _apollo_client = ApolloClient(api_key=get_api_key())
+        atexit.register(_close_apollo_client)
+    return _apollo_client
+
+
+def _close_apollo_client() -> None:
+    """
+    Drain the shared client's keepalive connections at exit.
+
+    Fallback for the `mcp run` import path; the `mcp` command closes the
+    client on its own loop in _serve_stdio, leaving nothing to do here.
+    """
+    if _apollo_client is None or _apollo_client.is_closed:
+        return
+    try:
+        asyncio.run(_apollo_client.aclose())
+    except Exception:
+        # The pooled connections belong to the serving loop, which is gone
+        logger.warning("Could not close the Apollo client at exit", exc_info=True)
 
 # All available tools organized by category
-ALL_TOOLS = {
-    'people': ['people_enrichment', 'people_bulk_enrichment', 'people_search'],
-    'organizations': ['organization_enrichment', 'organization_search', 'organization_job_postings'],
-    'contacts': ['contact_search', 'contact_create', 'contact_update', 'contact_bulk_create', 'contact_bulk_update'],
-    'accounts': ['account_search', 'account_create', 'account_update', 'account_bulk_create', 'account_bulk_update', 'account_add_to_list', 'account_remove_from_list'],
-    'misc': ['labels_list', 'usage_stats'],
-}
+ALL_TOOLS = MappingProxyType({
+    'people': ('people_enrichment', 'people_bulk_enrichment', 'people_mega_enrichment', 'people_search'),
+    'organizations': ('organization_enrichment', 'organization_search', 'organization_job_postings'),
+    'contacts': ('contact_search', 'contact_create', 'contact_update', 'contact_bulk_create', 'contact_bulk_update', 'contact_add_to_list', 'contact_remove_from_list'),
+    'accounts': ('account_search', 'account_create', 'account_update', 'account_bulk_create', 'account_bulk_update', 'account_add_to_list', 'account_remove_from_list'),
+    'misc': ('labels_list', 'usage_stats'),
+})
+
+# Set of all tool names
+ALL_TOOL_NAMES = frozenset(tool for tools in ALL_TOOLS.values() for tool in tools)
 
-# Flat list of all tool names
-ALL_TOOL_NAMES = [tool for tools in ALL_TOOLS.values() for tool in tools]
+# Tool name to category mapping (read-only)
+TOOL_TO_CATEGORY = MappingProxyType({tool: cat for cat, tools in ALL_TOOLS.items() for tool in tools})
 
-# Tool name to category mapping
-TOOL_TO_CATEGORY = {tool: cat for cat, tools in ALL_TOOLS.items() for tool in tools}
+# Category to its tools.<category>.register_tools, filled in lazily by get_registrar
+CATEGORY_TO_REGISTRAR = {}
 
 app = typer.Typer(
     name="apollo-io-mcp-server",
@@ -44,7 +119,7 @@ def parse_tool_list(tools_str: Optional[str]) -> list:
 def determine_enabled_tools(
     include: Optional[str] = None,
     exclude: Optional[str] = None
-) -> set:
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
     """
     Determine which tools to enable based on include/exclude lists.
 
@@ -53,7 +128,7 @@ def determine_enabled_tools(
         exclude: Comma-separated tool names to exclude
 
     Returns:
-        Set of tool names to enable
+        Tuple of (tool names to enable, categories with at least one enabled tool)
     """
     include_list = parse_tool_list(include)
     exclude_list = parse_tool_list(exclude)
@@ -78,31 +153,89 @@ def determine_enabled_tools(
             typer.echo(f"[Apollo MCP] Warning: Unknown excluded tools: {', '.join(invalid_tools)}", err=True)
         enabled_tools -= set(exclude_list)
 
-    return enabled_tools
+    enabled_categories = frozenset(TOOL_TO_CATEGORY[tool] for tool in enabled_tools)
+    return frozenset(enabled_tools), enabled_categories
 
 
-def register_tools_from_set(mcp, apollo_client, enabled_tools: set):
-    """Register only the specified tools with the MCP server."""
-    from tools import people, organizations, contacts, accounts, misc
+def client_lifespan(apollo_client):
+    """
+    Build a FastMCP lifespan that pre-warms the Apollo HTTP pool on startup.
 
-    # Determine which categories have at least one enabled tool
-    enabled_categories = {TOOL_TO_CATEGORY[tool] for tool in enabled_tools}
+    The lowlevel server enters the lifespan once per session (e.g. each SSE
+    connection), so it must not close the shared client; _close_apollo_client
+    does that at exit.
+    """
+    @asynccontextmanager
+    async def lifespan(server):
+        # Warm in the background so the MCP handshake isn't held up by it
+        warmup = asyncio.create_task(apollo_client.warmup())
+        try:
+            yield
+        finally:
+            warmup.cancel()
+    return lifespan
+
+
+class FilteredToolRegistrar:
+    """
+    Stand-in for FastMCP passed to the tool modules' register_tools().
+
+    Tools outside enabled_tools are never handed to FastMCP, so their argument
+    models and JSON schemas are not built at startup.
+    """
 
-    # Register tools by category
-    if 'people' in enabled_categories:
-        people.register_tools(mcp, apollo_client)
+    def __init__(self, mcp, enabled_tools: FrozenSet[str]):
+        self.mcp = mcp
+        self.enabled_tools = enabled_tools
 
-    if 'organizations' in enabled_categories:
-        organizations.register_tools(mcp, apollo_client)
+    def tool(self, *args, **kwargs):
+        register = self.mcp.tool(*args, **kwargs)
 
-    if 'contacts' in enabled_categories:
-        contacts.register_tools(mcp, apollo_client)
+        def decorator(fn):
+            if kwargs.get('name', fn.__name__) not in self.enabled_tools:
+                return fn
+            return register(fn)
+        return decorator
 
-    if 'accounts' in enabled_categories:
-        accounts.register_tools(mcp, apollo_client)
 
-    if 'misc' in enabled_categories:
-        misc.register_tools(mcp, apollo_client)
+def get_registrar(category: str):
+    """Return tools.<category>.register_tools, importing the module on first use."""
+    registrar = CATEGORY_TO_REGISTRAR.get(category)
+    if registrar is None:
+        registrar = importlib.import_module(f"tools.{category}").register_tools
+        CATEGORY_TO_REGISTRAR[category] = registrar
+    return registrar
+
+
+def register_tools_from_set(
+    mcp,
+    apollo_client,
+    enabled_tools: FrozenSet[str],
+    enabled_categories: Optional[FrozenSet[str]] = None
+):
+    """Register only the specified tools with the MCP server."""
+    if enabled_categories is None:
+        enabled_categories = frozenset(TOOL_TO_CATEGORY[tool] for tool in enabled_tools if tool in TOOL_TO_CATEGORY)
+    mcp = FilteredToolRegistrar(mcp, enabled_tools)
+
+    # Walk ALL_TOOLS rather than the set so tools are always listed in the same order
+    for category in ALL_TOOLS:
+        if category in enabled_categories:
+            get_registrar(category)(mcp, apollo_client)
+
+
+LIST_TOOLS_USAGE = (
+    "Usage:",
+    "  # Start server with all tools",
+    "  uv run mcp run server.py",
+    "",
+    "  # Start server with specific tools",
+    "  uv run mcp run server.py --include-tools=people_search,organization_enrichment",
+    "",
+    "  # Start server excluding specific tools",
+    "  uv run mcp run server.py --exclude-tools=account_bulk_create,account_bulk_update",
+    "",
+)
 
 
 @app.command()
@@ -116,42 +249,47 @@ def list_tools(
         None,
         "--exclude-tools",
         help="Filter to exclude these tools (comma-separated)"
+    ),
+    as_json: bool = typer.Option(
+        False,
+        "--json",
+        help="Print {category: [tools]} as JSON for scripting"
     )
 ):
     """List all available tools organized by category."""
     # Determine which tools to show
-    enabled_tools = determine_enabled_tools(include_tools, exclude_tools)
+    enabled_tools, _ = determine_enabled_tools(include_tools, exclude_tools)
+    typer.echo(render_tool_listing(enabled_tools, bool(include_tools or exclude_tools), as_json))
+
 
-    typer.echo("\n[Apollo.io MCP Server] Available Tools:\n")
+@functools.lru_cache(maxsize=None)
+def render_tool_listing(enabled_tools: FrozenSet[str], filtered: bool, as_json: bool) -> str:
+    """Render the list-tools output once per filter set; the registry is immutable."""
+    # Filter tools in each category, dropping empty categories
+    visible = {
+        category: [t for t in tools if t in enabled_tools]
+        for category, tools in ALL_TOOLS.items()
+    }
+    visible = {category: tools for category, tools in visible.items() if tools}
 
-    total = 0
-    for category, tools in ALL_TOOLS.items():
-        # Filter tools in this category
-        visible_tools = [t for t in tools if t in enabled_tools]
-        if not visible_tools:
-            continue
+    if as_json:
+        return json.dumps(visible, separators=(",", ":"))
 
-        typer.echo(f"  {category.upper()} ({len(visible_tools)} tools):")
-        for tool in visible_tools:
-            typer.echo(f"    - {tool}")
-        typer.echo()
-        total += len(visible_tools)
+    lines = ["", "[Apollo.io MCP Server] Available Tools:", ""]
+    for category, tools in visible.items():
+        lines.append(f"  {category.upper()} ({len(tools)} tools):")
+        lines.extend(f"    - {tool}" for tool in tools)
+        lines.append("")
 
-    typer.echo(f"Total: {total} tools\n")
+    lines.append(f"Total: {sum(len(tools) for tools in visible.values())} tools")
+    lines.append("")
 
-    if include_tools or exclude_tools:
-        typer.echo("Showing filtered tools based on your --include-tools/--exclude-tools options\n")
+    if filtered:
+        lines.append("Showing filtered tools based on your --include-tools/--exclude-tools options")
+        lines.append("")
 
-    typer.echo("Usage:")
-    typer.echo("  # Start server with all tools")
-    typer.echo("  uv run mcp run server.py")
-    typer.echo()
-    typer.echo("  # Start server with specific tools")
-    typer.echo("  uv run mcp run server.py --include-tools=people_search,organization_enrichment")
-    typer.echo()
-    typer.echo("  # Start server excluding specific tools")
-    typer.echo("  uv run mcp run server.py --exclude-tools=account_bulk_create,account_bulk_update")
-    typer.echo()
+    lines.extend(LIST_TOOLS_USAGE)
+    return "\n".join(lines)
 
 
 @app.command()
@@ -169,7 +307,7 @@ def mcp(
 ):
     """Start the Apollo.io MCP server."""
     # Determine enabled tools
-    enabled_tools = determine_enabled_tools(include_tools, exclude_tools)
+    enabled_tools, enabled_categories = determine_enabled_tools(include_tools, exclude_tools)
 
     if not enabled_tools:
         typer.echo("[Apollo MCP] Error: No tools enabled. Check your --include-tools/--exclude-tools filters.", err=True)
@@ -184,20 +322,26 @@ def mcp(
     else:
         typer.echo(f"[Apollo MCP] Loading all {len(enabled_tools)} tools", err=True)
 
-    # Support both APOLLO_IO_API_KEY (preferred) and APOLLO_API_KEY
-    api_key = os.getenv("APOLLO_IO_API_KEY") or os.getenv("APOLLO_API_KEY")
-    apollo_client = ApolloClient(api_key=api_key)
+    apollo_client = get_apollo_client()
 
-    mcp_instance = FastMCP("Apollo.io")
+    mcp_instance = FastMCP("Apollo.io", lifespan=client_lifespan(apollo_client))
 
     # Register tools
-    register_tools_from_set(mcp_instance, apollo_client, enabled_tools)
+    register_tools_from_set(mcp_instance, apollo_client, enabled_tools, enabled_categories)
 
     # Store mcp globally for FastMCP CLI
     globals()['mcp'] = mcp_instance
 
     # Run the MCP server (stdio)
-    mcp_instance.run()
+    anyio.run(_serve_stdio, mcp_instance, apollo_client)
+
+
+async def _serve_stdio(mcp_instance: FastMCP, apollo_client: ApolloClient) -> None:
+    """Serve MCP over stdio, then close the client on the loop that used it."""
+    try:
+        await mcp_instance.run_stdio_async()
+    finally:
+        await apollo_client.aclose()
 
 
 @app.callback(invoke_without_command=True)
@@ -225,25 +369,20 @@ if __name__ == "__main__":
     app()
 else:
     # For FastMCP compatibility when run via `mcp run server.py`
-    # Parse sys.argv for --include-tools and --exclude-tools options
-    include_arg = None
-    exclude_arg = None
-
-    for i, arg in enumerate(sys.argv):
-        if arg.startswith('--include-tools='):
-            include_arg = arg.split('=', 1)[1]
-        elif arg == '--include-tools' and i + 1 < len(sys.argv):
-            include_arg = sys.argv[i + 1]
-        elif arg.startswith('--exclude-tools='):
-            exclude_arg = arg.split('=', 1)[1]
-        elif arg == '--exclude-tools' and i + 1 < len(sys.argv):
-            exclude_arg = sys.argv[i + 1]
-
-    # Determine enabled tools
+    # Parse sys.argv for --include-tools and --exclude-tools options, leaving
+    # the rest (`mcp run` arguments) alone
+    parser = argparse.ArgumentParser(prog="server.py", add_help=False, allow_abbrev=False)
+    parser.add_argument('--include-tools')
+    parser.add_argument('--exclude-tools')
+    args, _ = parser.parse_known_args(sys.argv[1:])
+    include_arg = args.include_tools
+    exclude_arg = args.exclude_tools
+
+    # Determine enabled tools; unknown tool names have already been reported
     try:
-        enabled_tools = determine_enabled_tools(include_arg, exclude_arg)
-    except:
-        enabled_tools = set(ALL_TOOL_NAMES)  # Fallback to all tools on error
+        enabled_tools, enabled_categories = determine_enabled_tools(include_arg, exclude_arg)
+    except typer.Exit as e:
+        sys.exit(e.exit_code)
 
     # Show what's being loaded
     if include_arg:
@@ -255,9 +394,8 @@ else:
         typer.echo(f"[Apollo MCP] Loading all {len(enabled_tools)} tools", err=True)
 
     # Initialize
-    api_key = os.getenv("APOLLO_IO_API_KEY") or os.getenv("APOLLO_API_KEY")
-    apollo_client = ApolloClient(api_key=api_key)
-    mcp = FastMCP("Apollo.io")
+    apollo_client = get_apollo_client()
+    mcp = FastMCP("Apollo.io", lifespan=client_lifespan(apollo_client))
 
     # Register tools
-    register_tools_from_set(mcp, apollo_client, enabled_tools)
+    register_tools_from_set(mcp, apollo_client, enabled_tools, enabled_categories)
@@ -9,6 +9,16 @@ import asyncio
 from apollo_client import ApolloClient
 import os
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run(coro):
+    """Run a coroutine on uvloop when it's installed, else the default event loop."""
+    return uvloop.run(coro) if uvloop else asyncio.run(coro)
+
 async def test_with_real_api():
     """Test with real API (requires APOLLO_IO_API_KEY environment variable)"""
     api_key = os.getenv('APOLLO_IO_API_KEY')
@@ -24,10 +34,41 @@ async def test_with_real_api():
     print("Testing Apollo.io Bulk Operations & Usage Stats")
     print("=" * 60)
 
+    import time
+    timestamp = int(time.time())
+
+    contacts = [
+        {
+            "first_name": "Test",
+            "last_name": "User1",
+            "email": f"test-bulk-1-{timestamp}@example.com",
+            "title": "Test Engineer",
+            "organization_name": "Test Corp",
+            "label_names": ["MCP Test"]
+        },
+        {
+            "first_name": "Test",
+            "last_name": "User2",
+            "email": f"test-bulk-2-{timestamp}@example.com",
+            "title": "Test Manager",
+            "organization_name": "Test Corp",
+            "label_names": ["MCP Test"]
+        }
+    ]
+
+    # Usage stats don't depend on the contact flow, so fetch them while the
+    # bulk create is in flight and report both in order afterwards
+    stats, result = await asyncio.gather(
+        client.usage_stats(),
+        client.contact_bulk_create(contacts=contacts),
+        return_exceptions=True
+    )
+
     # Test 1: Usage Stats (master API key required)
     print("\n📊 Test 1: Getting API Usage Stats...")
     try:
-        stats = await client.usage_stats()
+        if isinstance(stats, Exception):
+            raise stats
         if stats:
             print("✅ Usage stats retrieved successfully!")
             stats_dict = stats.model_dump()
@@ -47,29 +88,8 @@ async def test_with_real_api():
     # Test 2: Bulk Create (creates test contacts)
     print("\n📝 Test 2: Bulk Creating Test Contacts...")
     try:
-        import time
-        timestamp = int(time.time())
-
-        contacts = [
-            {
-                "first_name": "Test",
-                "last_name": "User1",
-                "email": f"test-bulk-1-{timestamp}@example.com",
-                "title": "Test Engineer",
-                "organization_name": "Test Corp",
-                "label_names": ["MCP Test"]
-            },
-            {
-                "first_name": "Test",
-                "last_name": "User2",
-                "email": f"test-bulk-2-{timestamp}@example.com",
-                "title": "Test Manager",
-                "organization_name": "Test Corp",
-                "label_names": ["MCP Test"]
-            }
-        ]
-
-        result = await client.contact_bulk_create(contacts=contacts)
+        if isinstance(result, Exception):
+            raise result
         if result:
             print(f"✅ Bulk create completed!")
             print(f"   - Created: {len(result.created_contacts)} contacts")
@@ -106,6 +126,8 @@ async def test_with_real_api():
     except Exception as e:
         print(f"❌ Error: {e}")
 
+    await client.aclose()
+
     print("\n" + "=" * 60)
     print("✅ Testing complete!")
     print("=" * 60)
@@ -181,12 +203,12 @@ if __name__ == "__main__":
         print("   Press Ctrl+C to cancel, or Enter to continue...")
         try:
             input()
-            asyncio.run(test_with_real_api())
+            run(test_with_real_api())
         except KeyboardInterrupt:
             print("\n\n❌ Cancelled by user")
     else:
         print("ℹ️  APOLLO_IO_API_KEY not set - showing examples only\n")
-        asyncio.run(show_examples())
+        run(show_examples())
         print("\n💡 To test with real API:")
         print("   export APOLLO_IO_API_KEY='your_key_here'")
         print("   uv run python test_local.py")
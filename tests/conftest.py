@@ -1,35 +1,207 @@
 """
 Test configuration and fixtures for Apollo.io MCP Server tests.
 """
+import collections
+import functools
 import os
+import sys
+import types
 import pytest
+import pytest_asyncio
+import vcr
 from pathlib import Path
 from dotenv import load_dotenv
+from apollo_client import ApolloClient
+from vcr.persisters.filesystem import CassetteNotFoundError, FilesystemPersister
+from vcr.serialize import deserialize
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from tests import fixtures
+from tests.mock_apollo import MockApolloClient
+
+# Repository root holding server.py and apollo_client.py
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+@functools.lru_cache(maxsize=None)
+def load_env():
+    """Load .env files once per process (each xdist worker loads them once)."""
+    load_dotenv()
+    load_dotenv('.env.secrets')
+
+
+@functools.lru_cache(maxsize=None)
+def get_api_key():
+    """Apollo API key from the environment, or None."""
+    load_env()
+    return os.getenv("APOLLO_IO_API_KEY") or os.getenv("APOLLO_API_KEY")
+
 
 # Load environment variables
-load_dotenv()
-load_dotenv('.env.secrets')
+load_env()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--e2e",
+        action="store_true",
+        default=False,
+        help="Run server checks through real `uv run` subprocesses instead of in-process",
+    )
+    parser.addoption(
+        "--mock",
+        action="store_true",
+        default=False,
+        help="Serve apollo_client from the in-memory MockApolloClient, without cassettes or an API key",
+    )
+
+
+def pytest_configure(config):
+    # apollo_client and the apollo models are imported with this conftest,
+    # before collection, so each xdist worker pays for them once and the
+    # test modules' own imports are sys.modules hits. Resolve the API key
+    # up front as well.
+    get_api_key()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests needing an API key at collection time rather than in each test."""
+    if get_api_key():
+        return
+    # --mock only stands in for the API behind the apollo_client fixture
+    mock = config.getoption("--mock")
+    skip = pytest.mark.skip(reason="No Apollo API key found in environment")
+    for item in items:
+        fixturenames = getattr(item, "fixturenames", ())
+        if "apollo_api_key" in fixturenames and not (mock and "apollo_client" in fixturenames):
+            item.add_marker(skip)
 
 
 @pytest.fixture(scope="session")
 def apollo_api_key():
-    """Get Apollo API key from environment."""
-    api_key = os.getenv("APOLLO_IO_API_KEY") or os.getenv("APOLLO_API_KEY")
-    if not api_key:
-        pytest.skip("No Apollo API key found in environment")
-    return api_key
+    """Get Apollo API key from environment (tests are skipped at collection without one)."""
+    return get_api_key()
+
+
+def match_request(r1, r2):
+    """
+    VCR matcher comparing method and full URL in one step, without re-parsing the URL.
+
+    Returns a bool rather than asserting: VCR tries every recorded interaction
+    in turn, so most calls are mismatches, and raising and formatting an
+    AssertionError for each of them costs more than the comparison.
+    """
+    return r1.uri == r2.uri and r1.method == r2.method
+
+
+class BytesPersister(FilesystemPersister):
+    """Cassette persister that reads each file in one call and leaves decoding to the loader."""
+
+    @classmethod
+    def load_cassette(cls, cassette_path, serializer):
+        cassette_path = Path(cassette_path)
+        if not cassette_path.is_file():
+            raise CassetteNotFoundError()
+        return deserialize(cassette_path.read_bytes(), serializer)
+
+
+class OrjsonSerializer:
+    """VCR cassette serializer using orjson's C parser; cassettes stay plain JSON."""
+
+    @staticmethod
+    def deserialize(cassette_string):
+        return orjson.loads(cassette_string)
+
+    @staticmethod
+    def serialize(cassette_dict):
+        return orjson.dumps(cassette_dict, option=orjson.OPT_INDENT_2).decode() + "\n"
+
+
+def pytest_recording_configure(config, vcr):
+    vcr.register_matcher("request", match_request)
+    vcr.register_persister(BytesPersister)
+    if orjson:
+        # Replaces vcrpy's json serializer, so .json cassette names are unchanged
+        vcr.register_serializer("json", OrjsonSerializer)
 
 
 @pytest.fixture(scope="session")
-def vcr_cassette_dir():
-    """Directory for VCR cassettes."""
-    cassette_dir = Path(".scratch/http-tests")
+def usage_stats_response():
+    """USAGE_STATS_RESPONSE, shared read-only across the session."""
+    return fixtures.USAGE_STATS_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def server_module():
+    """The server module, imported once per session (once per xdist worker)."""
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+    import server
+    return server
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_cassette_dir():
+    """Create the VCR cassette directory once per process and return its path."""
+    cassette_dir = Path(".scratch/http-tests").resolve()
     cassette_dir.mkdir(parents=True, exist_ok=True)
     return str(cassette_dir)
 
 
-@pytest.fixture(scope="module")
-def vcr_config(vcr_cassette_dir):
+@pytest.fixture(scope="session")
+def vcr_cassette_dir():
+    """Directory for VCR cassettes."""
+    return ensure_cassette_dir()
+
+
+# Request headers replaced with REDACTED before a cassette is written
+REDACTED_HEADERS = frozenset({"x-api-key"})
+
+
+def redact_headers(request):
+    """before_record_request hook hiding the API key in cassettes."""
+    request.headers = {
+        name: "REDACTED" if name.lower() in REDACTED_HEADERS else value
+        for name, value in request.headers.items()
+    }
+    return request
+
+
+def cassette_record_mode(nodeid):
+    """
+    VCR record mode for the test (or test module) at `nodeid`.
+
+    Cassettes replay only unless VCR_RECORD_MODE says otherwise, so a missing
+    cassette fails fast instead of calling the API; set VCR_RECORD_MODE=once
+    to record new ones. When CASSETTE_REWRITE_PATH is set, tests whose node id
+    starts with it may record new interactions and every other test is
+    replay-only.
+    """
+    rewrite_path = os.environ.get("CASSETTE_REWRITE_PATH")
+    if rewrite_path is None:
+        return os.environ.get("VCR_RECORD_MODE", "none")
+    return "new_episodes" if nodeid.startswith(rewrite_path) else "none"
+
+
+def cassette_config(cassette_dir, record_mode="none"):
+    """Settings shared by the pytest-recording cassettes and the session fixtures below."""
+    return {
+        "cassette_library_dir": cassette_dir,
+        "record_mode": record_mode,
+        "match_on": ("request",),
+        "before_record_request": redact_headers,  # Hide API key in cassettes
+        "decode_compressed_response": True,
+        # JSON cassettes replay without a YAML parse; names end in .json
+        "serializer": "json",
+    }
+
+
+@pytest.fixture
+def vcr_config(request, vcr_cassette_dir):
     """
     VCR.py configuration for recording HTTP interactions.
 
@@ -37,12 +209,61 @@ def vcr_config(vcr_cassette_dir):
     This allows us to record real API interactions for validation without
     exposing sensitive data in the repository.
     """
-    return {
-        "cassette_library_dir": vcr_cassette_dir,
-        "record_mode": "once",  # Record once, then replay
-        "match_on": ["method", "scheme", "host", "port", "path", "query"],
-        "filter_headers": [
-            ("x-api-key", "REDACTED"),  # Hide API key in cassettes
-        ],
-        "decode_compressed_response": True,
-    }
+    return cassette_config(vcr_cassette_dir, cassette_record_mode(request.node.nodeid))
+
+
+@pytest.fixture(scope="session")
+def disable_recording(request):
+    """pytest-recording switch; mock runs never touch cassettes."""
+    return request.config.getoption("--disable-recording") or request.config.getoption("--mock")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def apollo_client(apollo_api_key, pytestconfig):
+    """One ApolloClient per session (per xdist worker), closed when the session ends."""
+    if pytestconfig.getoption("--mock"):
+        client = MockApolloClient()
+    else:
+        client = ApolloClient(api_key=apollo_api_key)
+    yield client
+    await client.aclose()
+
+
+# Node id prefix of the tests whose cassettes list_custom_fields replays
+CUSTOM_FIELDS_TESTS = "tests/integration/test_custom_fields.py"
+
+
+async def list_custom_fields(client, modality):
+    """
+    custom_fields_list for one modality, replayed from the list test's cassette.
+
+    Returns the fields as `typed_custom_fields` plus `by_type`, the same fields
+    grouped by field type once so tests don't rescan the list; None on error.
+    """
+    if isinstance(client, MockApolloClient):
+        result = await client.custom_fields_list(modality=modality)
+    else:
+        # The listing shares its cassette with the custom field list tests
+        record_mode = cassette_record_mode(CUSTOM_FIELDS_TESTS)
+        recorder = vcr.VCR(**cassette_config(ensure_cassette_dir(), record_mode))
+        pytest_recording_configure(None, recorder)
+        with recorder.use_cassette(f"custom_fields_list_{modality}.json"):
+            result = await client.custom_fields_list(modality=modality)
+    if result is None:
+        return None
+    by_type = collections.defaultdict(list)
+    for field in result.typed_custom_fields:
+        by_type[field.type].append(field)
+    return types.SimpleNamespace(typed_custom_fields=result.typed_custom_fields, by_type=dict(by_type))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def contact_custom_fields(apollo_client):
+    """Contact custom fields, listed once per session."""
+    return await list_custom_fields(apollo_client, "contact")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def account_custom_fields(apollo_client):
+    """Account custom fields, listed once per session."""
+    return await list_custom_fields(apollo_client, "account")
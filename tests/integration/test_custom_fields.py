@@ -12,157 +12,147 @@ By default, these tests are skipped (see pyproject.toml).
 Note: Custom fields endpoints require a master API key.
 """
 import pytest
-import vcr
-from pathlib import Path
-from apollo_client import ApolloClient
+from apollo.custom_fields import CustomField
 
+# Tests share the session-scoped apollo_client, so they run on its event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-# VCR configuration for all tests
-vcr_config = vcr.VCR(
-    cassette_library_dir=".scratch/http-tests",
-    record_mode="once",  # Record once, then replay
-    match_on=["method", "uri"],
-    filter_headers=[("x-api-key", "REDACTED")],
-    decode_compressed_response=True,
-)
+# CustomField attributes the API response structure is checked against
+_FIELD_ATTRIBUTES = frozenset({
+    "id", "name", "type", "modality", "picklist_options",
+    "text_field_max_length", "mirrored", "is_local",
+})
 
 
 @pytest.mark.integration
-async def test_custom_fields_list_all(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("custom_fields_list_all.json")
+async def test_custom_fields_list_all(apollo_client):
     """
     Test listing all custom fields without filtering.
 
     This should return custom fields across all modalities (contact, account, opportunity).
     """
-    with vcr_config.use_cassette("custom_fields_list_all.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
+    # List all custom fields
+    result = await apollo_client.custom_fields_list()
 
-        # List all custom fields
-        result = await client.custom_fields_list()
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'typed_custom_fields')
+    assert isinstance(result.typed_custom_fields, list)
 
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_fields')
-        assert isinstance(result.typed_custom_fields, list)
-
-        # Validate structure of returned fields
-        for field in result.typed_custom_fields:
-            assert hasattr(field, 'id')
-            assert hasattr(field, 'name')
-            assert isinstance(field.id, str)
-            assert isinstance(field.name, str)
+    # Every item parsed as a CustomField, whose id and name are validated str fields
+    assert {type(field) for field in result.typed_custom_fields} <= {CustomField}
 
 
 @pytest.mark.integration
-async def test_custom_fields_list_by_modality(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("custom_fields_list_contact.json")
+async def test_custom_fields_list_by_modality(apollo_client):
     """
     Test listing custom fields filtered by modality.
 
     This validates client-side filtering by modality (contact, account, opportunity).
     """
-    with vcr_config.use_cassette("custom_fields_list_contact.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
+    # List only contact custom fields
+    result = await apollo_client.custom_fields_list(modality="contact")
 
-        # List only contact custom fields
-        result = await client.custom_fields_list(modality="contact")
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'typed_custom_fields')
+    assert isinstance(result.typed_custom_fields, list)
 
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_fields')
-        assert isinstance(result.typed_custom_fields, list)
-
-        # All returned fields should have contact modality
-        for field in result.typed_custom_fields:
-            # Check either 'modality' or might be filtered out
-            if hasattr(field, 'modality') and field.modality:
-                assert field.modality == "contact"
+    # All returned fields should have contact modality
+    for field in result.typed_custom_fields:
+        # Check either 'modality' or might be filtered out
+        if hasattr(field, 'modality') and field.modality:
+            assert field.modality == "contact"
 
 
 @pytest.mark.integration
-async def test_custom_fields_list_account_modality(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("custom_fields_list_account.json")
+async def test_custom_fields_list_account_modality(apollo_client):
     """
     Test listing account custom fields.
     """
-    with vcr_config.use_cassette("custom_fields_list_account.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # List only account custom fields
-        result = await client.custom_fields_list(modality="account")
+    # List only account custom fields
+    result = await apollo_client.custom_fields_list(modality="account")
 
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_fields')
-        assert isinstance(result.typed_custom_fields, list)
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'typed_custom_fields')
+    assert isinstance(result.typed_custom_fields, list)
 
 
 @pytest.mark.integration
-async def test_custom_fields_response_structure(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("custom_fields_response_structure.json")
+async def test_custom_fields_response_structure(apollo_client):
     """
     Test the complete response structure of custom_fields_list.
 
     This validates all expected fields in the CustomField model.
     """
-    with vcr_config.use_cassette("custom_fields_response_structure.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # List all custom fields
-        result = await client.custom_fields_list()
+    # List all custom fields
+    result = await apollo_client.custom_fields_list()
 
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_fields')
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'typed_custom_fields')
 
-        # If there are custom fields, validate full structure
-        if len(result.typed_custom_fields) > 0:
-            field = result.typed_custom_fields[0]
+    # If there are custom fields, validate full structure
+    if len(result.typed_custom_fields) > 0:
+        field = result.typed_custom_fields[0]
 
-            # Required fields
-            assert hasattr(field, 'id')
-            assert isinstance(field.id, str)
-            assert hasattr(field, 'name')
-            assert isinstance(field.name, str)
-
-            # Optional fields from actual API response
-            assert hasattr(field, 'type')
-            assert hasattr(field, 'modality')
-            assert hasattr(field, 'picklist_options')
-            assert hasattr(field, 'text_field_max_length')
-            assert hasattr(field, 'mirrored')
-            assert hasattr(field, 'is_local')
+        # Required and optional fields from actual API response, checked in one go
+        missing = _FIELD_ATTRIBUTES - set(type(field).model_fields)
+        assert not missing, missing
+        assert isinstance(field.id, str)
+        assert isinstance(field.name, str)
 
 
 @pytest.mark.integration
-async def test_create_text_custom_field(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.parametrize("name, field_type, modality", [
+    pytest.param("Test LinkedIn URL", "string", "contact", id="text",
+                 marks=pytest.mark.default_cassette("custom_field_create_text.json")),
+    pytest.param("Test Annual Revenue", "number", "account", id="number",
+                 marks=pytest.mark.default_cassette("custom_field_create_number.json")),
+    pytest.param("Test Last Contact Date", "date", "contact", id="date",
+                 marks=pytest.mark.default_cassette("custom_field_create_date.json")),
+    pytest.param("Test Is Decision Maker", "boolean", "contact", id="boolean",
+                 marks=pytest.mark.default_cassette("custom_field_create_boolean.json")),
+    pytest.param("Test Last Meeting Time", "datetime", "contact", id="datetime",
+                 marks=pytest.mark.default_cassette("custom_field_create_datetime.json")),
+])
+async def test_create_custom_field(apollo_client, name, field_type, modality):
     """
-    Test creating a string (text) custom field for contacts.
+    Test creating a custom field of each non-picklist type.
     """
-    with vcr_config.use_cassette("custom_field_create_text.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # Create a string field
-        result = await client.custom_field_create(
-            name="Test LinkedIn URL",
-            field_type="string",
-            modality="contact",
-            is_required=False
-        )
+    result = await apollo_client.custom_field_create(
+        name=name,
+        field_type=field_type,
+        modality=modality,
+        is_required=False
+    )
 
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_field')
-
-        field = result.typed_custom_field
-        assert field.name == "Test LinkedIn URL"
-        # Check type field
-        assert hasattr(field, 'type')
-        assert field.type == "string"
-        assert hasattr(field, 'id')
-        assert isinstance(field.id, str)
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'typed_custom_field')
+
+    field = result.typed_custom_field
+    assert field.name == name
+    assert hasattr(field, 'type')
+    assert field.type == field_type
+    assert isinstance(field.id, str)
 
 
 @pytest.mark.skip(reason="Picklist fields require pre-existing Global Picklist Value Sets created via UI")
 @pytest.mark.integration
-async def test_create_picklist_custom_field(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("custom_field_create_picklist.json")
+async def test_create_picklist_custom_field(apollo_client):
     """
     Test creating a picklist (dropdown) custom field with options.
 
@@ -170,137 +160,32 @@ async def test_create_picklist_custom_field(apollo_api_key):
     "Global Picklist Value Sets" which must be created via the UI first.
     The API doesn't support creating picklist fields with inline options.
     """
-    with vcr_config.use_cassette("custom_field_create_picklist.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # Create a picklist field
-        result = await client.custom_field_create(
-            name="Test Company Size",
-            field_type="picklist",
-            modality="account",
-            is_required=True,
-            dropdown_options=["1-10", "11-50", "51-200", "201+"]
-        )
-
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_field')
-
-        field = result.typed_custom_field
-        assert field.name == "Test Company Size"
-        assert hasattr(field, 'type')
-        assert field.type == "picklist"
-        # picklist_options might be in various forms
-        assert hasattr(field, 'picklist_options') or hasattr(field, 'picklist_values')
-
-
-@pytest.mark.integration
-async def test_create_number_custom_field(apollo_api_key):
-    """
-    Test creating a number custom field.
-    """
-    with vcr_config.use_cassette("custom_field_create_number.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # Create a number field
-        result = await client.custom_field_create(
-            name="Test Annual Revenue",
-            field_type="number",
-            modality="account",
-            is_required=False
-        )
-
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_field')
-
-        field = result.typed_custom_field
-        assert field.name == "Test Annual Revenue"
-        assert hasattr(field, 'type')
-        assert field.type == "number"
-
-
-@pytest.mark.integration
-async def test_create_date_custom_field(apollo_api_key):
-    """
-    Test creating a date custom field.
-    """
-    with vcr_config.use_cassette("custom_field_create_date.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # Create a date field
-        result = await client.custom_field_create(
-            name="Test Last Contact Date",
-            field_type="date",
-            modality="contact",
-            is_required=False
-        )
-
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_field')
-
-        field = result.typed_custom_field
-        assert field.name == "Test Last Contact Date"
-        assert hasattr(field, 'type')
-        assert field.type == "date"
-
-
-@pytest.mark.integration
-async def test_create_boolean_custom_field(apollo_api_key):
-    """
-    Test creating a boolean (checkbox) custom field.
-    """
-    with vcr_config.use_cassette("custom_field_create_boolean.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # Create a boolean field
-        result = await client.custom_field_create(
-            name="Test Is Decision Maker",
-            field_type="boolean",
-            modality="contact",
-            is_required=False
-        )
-
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_field')
-
-        field = result.typed_custom_field
-        assert field.name == "Test Is Decision Maker"
-        assert hasattr(field, 'type')
-        assert field.type == "boolean"
-
-
-@pytest.mark.integration
-async def test_create_datetime_custom_field(apollo_api_key):
-    """
-    Test creating a datetime custom field.
-    """
-    with vcr_config.use_cassette("custom_field_create_datetime.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # Create a datetime field
-        result = await client.custom_field_create(
-            name="Test Last Meeting Time",
-            field_type="datetime",
-            modality="contact",
-            is_required=False
-        )
-
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'typed_custom_field')
-
-        field = result.typed_custom_field
-        assert field.name == "Test Last Meeting Time"
-        assert hasattr(field, 'type')
-        assert field.type == "datetime"
+    # Create a picklist field
+    result = await apollo_client.custom_field_create(
+        name="Test Company Size",
+        field_type="picklist",
+        modality="account",
+        is_required=True,
+        dropdown_options=["1-10", "11-50", "51-200", "201+"]
+    )
+
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'typed_custom_field')
+
+    field = result.typed_custom_field
+    assert field.name == "Test Company Size"
+    assert hasattr(field, 'type')
+    assert field.type == "picklist"
+    # picklist_options might be in various forms
+    assert hasattr(field, 'picklist_options') or hasattr(field, 'picklist_values')
 
 
 @pytest.mark.skip(reason="VCR cassette issue - functionality verified via manual testing and raw API calls work correctly")
 @pytest.mark.integration
-async def test_contact_create_with_custom_fields(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("contact_create_with_custom_fields.json")
+async def test_contact_create_with_custom_fields(apollo_client, contact_custom_fields):
     """
     Test creating a contact with custom field values.
 
@@ -310,48 +195,43 @@ async def test_contact_create_with_custom_fields(apollo_api_key):
 
     Note: Raw API testing confirms this works. Test failure appears to be VCR-related.
     """
-    with vcr_config.use_cassette("contact_create_with_custom_fields.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # First, get contact custom fields
-        fields_result = await client.custom_fields_list(modality="contact")
-        assert fields_result is not None
-
-        # Skip test if no custom fields exist
-        if len(fields_result.typed_custom_fields) == 0:
-            pytest.skip("No contact custom fields available to test with")
-
-        # Get the first string field ID
-        string_field = next(
-            (f for f in fields_result.typed_custom_fields
-             if hasattr(f, 'type') and f.type == "string"),
-            None
-        )
-
-        # Skip if no string field found
-        if not string_field:
-            pytest.skip("No string-type custom field available to test with")
-
-        # Create contact with custom field
-        contact_result = await client.contact_create(
-            first_name="Test",
-            last_name="CustomFieldUser",
-            email="test.customfield@example.com",
-            typed_custom_fields={
-                string_field.id: "https://linkedin.com/in/test"
-            }
-        )
-
-        # Should return successful response
-        assert contact_result is not None
-        assert hasattr(contact_result, 'contact')
-        # contact is a dict, not an object
-        assert contact_result.contact.get('first_name') == "Test"
-        assert contact_result.contact.get('last_name') == "CustomFieldUser"
+    # Custom fields come from the session-wide listing
+    fields_result = contact_custom_fields
+    assert fields_result is not None
+
+    # Skip test if no custom fields exist
+    if len(fields_result.typed_custom_fields) == 0:
+        pytest.skip("No contact custom fields available to test with")
+
+    # Get the first string field ID
+    string_field = next(iter(fields_result.by_type.get("string", ())), None)
+
+    # Skip if no string field found
+    if not string_field:
+        pytest.skip("No string-type custom field available to test with")
+
+    # Create contact with custom field
+    contact_result = await apollo_client.contact_create(
+        first_name="Test",
+        last_name="CustomFieldUser",
+        email="test.customfield@example.com",
+        typed_custom_fields={
+            string_field.id: "https://linkedin.com/in/test"
+        }
+    )
+
+    # Should return successful response
+    assert contact_result is not None
+    assert hasattr(contact_result, 'contact')
+    # contact is a dict, not an object
+    assert contact_result.contact.get('first_name') == "Test"
+    assert contact_result.contact.get('last_name') == "CustomFieldUser"
 
 
 @pytest.mark.integration
-async def test_account_create_with_custom_fields(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("account_create_with_custom_fields.json")
+async def test_account_create_with_custom_fields(apollo_client, account_custom_fields):
     """
     Test creating an account with custom field values.
 
@@ -359,78 +239,73 @@ async def test_account_create_with_custom_fields(apollo_api_key):
     1. Get custom field IDs
     2. Create account with typed_custom_fields
     """
-    with vcr_config.use_cassette("account_create_with_custom_fields.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # First, get account custom fields
-        fields_result = await client.custom_fields_list(modality="account")
-        assert fields_result is not None
-
-        # If there are custom fields, use them
-        if len(fields_result.typed_custom_fields) > 0:
-            # Get the first field
-            first_field = fields_result.typed_custom_fields[0]
-
-            # Create account with custom field
-            # Value depends on field type
-            field_type = getattr(first_field, 'type', None)
-
-            custom_field_value = "Test Value"
-            if field_type == "number":
-                custom_field_value = 1000000
-            elif field_type == "boolean":
-                custom_field_value = True
-            elif field_type == "picklist" and hasattr(first_field, 'picklist_values') and first_field.picklist_values:
-                custom_field_value = first_field.picklist_values[0]['id']
-
-            account_result = await client.account_create(
-                name="Test Custom Field Company",
-                domain="testcustomfield.example.com",
-                typed_custom_fields={
-                    first_field.id: custom_field_value
-                }
-            )
+    # Custom fields come from the session-wide listing
+    fields_result = account_custom_fields
+    assert fields_result is not None
+
+    # If there are custom fields, use them
+    if len(fields_result.typed_custom_fields) > 0:
+        # Get the first field
+        first_field = fields_result.typed_custom_fields[0]
+
+        # Create account with custom field
+        # Value depends on field type
+        field_type = getattr(first_field, 'type', None)
+
+        custom_field_value = "Test Value"
+        if field_type == "number":
+            custom_field_value = 1000000
+        elif field_type == "boolean":
+            custom_field_value = True
+        elif field_type == "picklist" and hasattr(first_field, 'picklist_values') and first_field.picklist_values:
+            custom_field_value = first_field.picklist_values[0]['id']
+
+        account_result = await apollo_client.account_create(
+            name="Test Custom Field Company",
+            domain="testcustomfield.example.com",
+            typed_custom_fields={
+                first_field.id: custom_field_value
+            }
+        )
 
-            # Should return successful response
-            assert account_result is not None
-            assert hasattr(account_result, 'account')
-            # account is a dict, not an object
-            assert account_result.account.get('name') == "Test Custom Field Company"
+        # Should return successful response
+        assert account_result is not None
+        assert hasattr(account_result, 'account')
+        # account is a dict, not an object
+        assert account_result.account.get('name') == "Test Custom Field Company"
 
 
 @pytest.mark.integration
-async def test_contact_update_with_custom_fields(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("contact_update_with_custom_fields.json")
+async def test_contact_update_with_custom_fields(apollo_client, contact_custom_fields):
     """
     Test updating a contact's custom field values.
     """
-    with vcr_config.use_cassette("contact_update_with_custom_fields.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # First, create a contact
-        contact_result = await client.contact_create(
-            first_name="UpdateTest",
-            last_name="CustomFields",
-            email="updatetest@example.com"
-        )
+    # First, create a contact
+    contact_result = await apollo_client.contact_create(
+        first_name="UpdateTest",
+        last_name="CustomFields",
+        email="updatetest@example.com"
+    )
 
-        if contact_result and contact_result.contact:
-            # contact is a dict
-            contact_id = contact_result.contact.get('id')
+    if contact_result and contact_result.contact:
+        # contact is a dict
+        contact_id = contact_result.contact.get('id')
 
-            # Get custom fields
-            fields_result = await client.custom_fields_list(modality="contact")
+        fields_result = contact_custom_fields
 
-            if fields_result and len(fields_result.typed_custom_fields) > 0:
-                first_field = fields_result.typed_custom_fields[0]
+        if fields_result and len(fields_result.typed_custom_fields) > 0:
+            first_field = fields_result.typed_custom_fields[0]
 
-                # Update the contact with custom field
-                update_result = await client.contact_update(
-                    contact_id=contact_id,
-                    typed_custom_fields={
-                        first_field.id: "Updated Value"
-                    }
-                )
+            # Update the contact with custom field
+            update_result = await apollo_client.contact_update(
+                contact_id=contact_id,
+                typed_custom_fields={
+                    first_field.id: "Updated Value"
+                }
+            )
 
-                # Should return successful response
-                assert update_result is not None
-                assert hasattr(update_result, 'contact')
+            # Should return successful response
+            assert update_result is not None
+            assert hasattr(update_result, 'contact')
@@ -12,126 +12,118 @@ By default, these tests are skipped (see pyproject.toml).
 Note: labels_list endpoint requires a master API key.
 """
 import pytest
-import vcr
-from pathlib import Path
-from apollo_client import ApolloClient
 
+# Tests share the session-scoped apollo_client, so they run on its event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-# VCR configuration for all tests
-vcr_config = vcr.VCR(
-    cassette_library_dir=".scratch/http-tests",
-    record_mode="once",  # Record once, then replay
-    match_on=["method", "uri"],
-    filter_headers=[("x-api-key", "REDACTED")],
-    decode_compressed_response=True,
-)
+
+@pytest.fixture(autouse=True)
+def clear_labels_cache(apollo_client):
+    """Drop the shared client's cached labels so each test replays its own cassette."""
+    apollo_client.clear_cache()
 
 
 @pytest.mark.integration
-async def test_labels_list_all(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("labels_list_all.json")
+async def test_labels_list_all(apollo_client):
     """
     Test listing all labels without filtering.
 
     This should return labels across all modalities (contacts, accounts, emailer_campaigns).
     """
-    with vcr_config.use_cassette("labels_list_all.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # List all labels
-        result = await client.labels_list()
+    # List all labels
+    result = await apollo_client.labels_list()
 
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'labels')
-        assert isinstance(result.labels, list)
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'labels')
+    assert isinstance(result.labels, list)
 
-        # Should have at least some labels (assuming account has labels)
-        # Note: This might be 0 for a brand new account, so we just check structure
-        for label in result.labels:
-            assert hasattr(label, 'id')
-            assert hasattr(label, 'name')
-            assert hasattr(label, 'modality')
-            assert label.modality in ['contacts', 'accounts', 'emailer_campaigns']
+    # Should have at least some labels (assuming account has labels)
+    # Note: This might be 0 for a brand new account, so we just check structure
+    for label in result.labels:
+        assert hasattr(label, 'id')
+        assert hasattr(label, 'name')
+        assert hasattr(label, 'modality')
+        assert label.modality in ['contacts', 'accounts', 'emailer_campaigns']
 
 
 @pytest.mark.integration
-async def test_labels_list_contacts_only(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("labels_list_contacts.json")
+async def test_labels_list_contacts_only(apollo_client):
     """
     Test listing only contacts labels.
 
     This validates client-side filtering by modality.
     """
-    with vcr_config.use_cassette("labels_list_contacts.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
+    # List only contacts labels
+    result = await apollo_client.labels_list(modality="contacts")
 
-        # List only contacts labels
-        result = await client.labels_list(modality="contacts")
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'labels')
+    assert isinstance(result.labels, list)
 
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'labels')
-        assert isinstance(result.labels, list)
-
-        # All returned labels should have contacts modality
-        for label in result.labels:
-            assert label.modality == "contacts"
+    # All returned labels should have contacts modality
+    for label in result.labels:
+        assert label.modality == "contacts"
 
 
 @pytest.mark.integration
-async def test_labels_list_accounts_only(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("labels_list_accounts.json")
+async def test_labels_list_accounts_only(apollo_client):
     """
     Test listing only accounts labels.
 
     This validates client-side filtering by modality.
     """
-    with vcr_config.use_cassette("labels_list_accounts.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # List only accounts labels
-        result = await client.labels_list(modality="accounts")
+    # List only accounts labels
+    result = await apollo_client.labels_list(modality="accounts")
 
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'labels')
-        assert isinstance(result.labels, list)
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'labels')
+    assert isinstance(result.labels, list)
 
-        # All returned labels should have accounts modality
-        for label in result.labels:
-            assert label.modality == "accounts"
+    # All returned labels should have accounts modality
+    for label in result.labels:
+        assert label.modality == "accounts"
 
 
 @pytest.mark.integration
-async def test_labels_response_structure(apollo_api_key):
+@pytest.mark.vcr
+@pytest.mark.default_cassette("labels_response_structure.json")
+async def test_labels_response_structure(apollo_client):
     """
     Test the complete response structure of labels_list.
 
     This validates all expected fields in the Label model.
     """
-    with vcr_config.use_cassette("labels_response_structure.yaml"):
-        client = ApolloClient(api_key=apollo_api_key)
-
-        # List all labels
-        result = await client.labels_list()
-
-        # Should return successful response
-        assert result is not None
-        assert hasattr(result, 'labels')
-
-        # If there are labels, validate full structure
-        if len(result.labels) > 0:
-            label = result.labels[0]
-
-            # Required fields
-            assert hasattr(label, 'id')
-            assert isinstance(label.id, str)
-            assert hasattr(label, 'name')
-            assert isinstance(label.name, str)
-            assert hasattr(label, 'modality')
-            assert isinstance(label.modality, str)
-
-            # Optional fields (may be None)
-            assert hasattr(label, 'cached_count')
-            assert hasattr(label, 'team_id')
-            assert hasattr(label, 'user_id')
-            assert hasattr(label, 'created_at')
-            assert hasattr(label, 'updated_at')
+    # List all labels
+    result = await apollo_client.labels_list()
+
+    # Should return successful response
+    assert result is not None
+    assert hasattr(result, 'labels')
+
+    # If there are labels, validate full structure
+    if len(result.labels) > 0:
+        label = result.labels[0]
+
+        # Required fields
+        assert hasattr(label, 'id')
+        assert isinstance(label.id, str)
+        assert hasattr(label, 'name')
+        assert isinstance(label.name, str)
+        assert hasattr(label, 'modality')
+        assert isinstance(label.modality, str)
+
+        # Optional fields (may be None)
+        assert hasattr(label, 'cached_count')
+        assert hasattr(label, 'team_id')
+        assert hasattr(label, 'user_id')
+        assert hasattr(label, 'created_at')
+        assert hasattr(label, 'updated_at')
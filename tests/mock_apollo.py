@@ -0,0 +1,226 @@
+"""
+In-memory stand-in for ApolloClient, used by `pytest -m integration --mock`.
+
+MockApolloClient implements the client methods the integration tests call
+and answers from seeded dicts, so a mock run walks through each test's flow
+without VCR cassettes, httpx or an API key. It returns the same apollo
+response models as the real client; the organization models are built with
+model_construct since the API marks far more of their fields as required
+than a seed needs.
+"""
+import itertools
+from typing import Any, Dict, List, Optional
+
+from apollo import (
+    AccountBulkCreateResponse,
+    AccountCreateResponse,
+    AccountSearchResponse,
+    AccountUpdateResponse,
+    ContactCreateResponse,
+    ContactSearchResponse,
+    ContactUpdateResponse,
+    OrganizationEnrichmentQuery,
+    OrganizationEnrichmentResponse,
+    OrganizationJobPostingsResponse,
+    OrganizationSearchQuery,
+    OrganizationSearchResponse,
+)
+from apollo.custom_fields import CustomField, CustomFieldCreateResponse, CustomFieldListResponse
+from apollo.labels import Label, LabelListResponse
+from apollo.organization import Organization
+from tests.fixtures import ACCOUNTS_SEARCH_WITH_RESULTS, LABELS_LIST_ALL, mutable
+
+# Custom fields every mock client starts with, one per modality and common type
+SEED_CUSTOM_FIELDS = (
+    {"id": "cf_contact_linkedin", "name": "LinkedIn URL", "type": "string", "modality": "contact"},
+    {"id": "cf_contact_score", "name": "Lead Score", "type": "number", "modality": "contact"},
+    {"id": "cf_account_revenue", "name": "Annual Revenue", "type": "number", "modality": "account"},
+)
+
+
+class MockApolloClient:
+    """ApolloClient look-alike backed by in-memory accounts, contacts, labels and custom fields."""
+
+    def __init__(self):
+        self.accounts: List[Dict[str, Any]] = mutable(ACCOUNTS_SEARCH_WITH_RESULTS["accounts"])
+        self.contacts: Dict[str, Dict[str, Any]] = {}
+        self.labels: List[Dict[str, Any]] = mutable(LABELS_LIST_ALL)
+        self.custom_fields = [CustomField(**field) for field in SEED_CUSTOM_FIELDS]
+        self._ids = itertools.count(1)
+
+    def _new_id(self, kind: str) -> str:
+        return f"mock_{kind}_{next(self._ids)}"
+
+    def _account(self, account_id: str) -> Optional[Dict[str, Any]]:
+        return next((account for account in self.accounts if account["id"] == account_id), None)
+
+    @staticmethod
+    def _page(items: List[Dict[str, Any]], page: int, per_page: int) -> Dict[str, Any]:
+        start = (page - 1) * per_page
+        return {
+            "items": items[start:start + per_page],
+            # A dict, since the contacts and accounts responses each declare their own Pagination
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total_entries": len(items),
+                "total_pages": -(-len(items) // per_page),
+            },
+        }
+
+    async def aclose(self) -> None:
+        pass
+
+    def clear_cache(self) -> None:
+        pass
+
+    # Custom fields
+
+    async def custom_fields_list(self, modality: Optional[str] = None) -> CustomFieldListResponse:
+        fields = [field for field in self.custom_fields if modality in (None, field.modality)]
+        return CustomFieldListResponse(typed_custom_fields=fields)
+
+    async def custom_field_create(
+        self,
+        name: str,
+        field_type: str,
+        modality: str,
+        is_required: bool = False,
+        dropdown_options: Optional[List[str]] = None
+    ) -> CustomFieldCreateResponse:
+        field = CustomField(
+            id=self._new_id("field"),
+            name=name,
+            type=field_type,
+            modality=modality,
+            picklist_options=dropdown_options,
+        )
+        self.custom_fields.append(field)
+        return CustomFieldCreateResponse(typed_custom_field=field)
+
+    # Contacts
+
+    async def contact_search(
+        self,
+        query: Optional[str] = None,
+        label_ids: Optional[List[str]] = None,
+        page: int = 1,
+        per_page: int = 25
+    ) -> ContactSearchResponse:
+        matches = [
+            contact for contact in self.contacts.values()
+            if query is None or query.lower() in " ".join(str(value) for value in contact.values()).lower()
+        ]
+        if label_ids:
+            matches = [contact for contact in matches if set(label_ids) & set(contact.get("label_ids", ()))]
+        result = self._page(matches, page, min(per_page, 100))
+        return ContactSearchResponse(contacts=result["items"], pagination=result["pagination"])
+
+    async def contact_create(self, first_name: str, last_name: str, **fields) -> ContactCreateResponse:
+        contact = {"id": self._new_id("contact"), "first_name": first_name, "last_name": last_name}
+        contact.update((key, value) for key, value in fields.items() if value is not None)
+        self.contacts[contact["id"]] = contact
+        return ContactCreateResponse(contact=contact)
+
+    async def contact_update(self, contact_id: str, **fields) -> Optional[ContactUpdateResponse]:
+        contact = self.contacts.get(contact_id)
+        if contact is None:
+            return None
+        contact.update(fields)
+        return ContactUpdateResponse(contact=contact)
+
+    # Labels
+
+    async def labels_list(self, modality: Optional[str] = None, raw: bool = False):
+        labels = [label for label in self.labels if modality in (None, label["modality"])]
+        if raw:
+            return {"labels": labels}
+        return LabelListResponse(labels=[Label(**label) for label in labels])
+
+    # Organizations
+
+    async def organization_enrichment(self, query: OrganizationEnrichmentQuery) -> OrganizationEnrichmentResponse:
+        organization = Organization.model_construct(
+            id=self._new_id("org"),
+            name=query.domain,
+            primary_domain=query.domain,
+        )
+        return OrganizationEnrichmentResponse.model_construct(organization=organization)
+
+    async def organization_search(self, query: OrganizationSearchQuery, raw: bool = False):
+        response = {
+            "organizations": [],
+            "pagination": {"page": query.page or 1, "per_page": query.per_page or 25, "total_entries": 0, "total_pages": 0},
+        }
+        return response if raw else OrganizationSearchResponse(**response)
+
+    async def organization_job_postings(self, organization_id: str, raw: bool = False):
+        response = {"organization_job_postings": []}
+        return response if raw else OrganizationJobPostingsResponse(**response)
+
+    # Accounts
+
+    async def account_search(
+        self,
+        query: Optional[str] = None,
+        label_ids: Optional[List[str]] = None,
+        page: int = 1,
+        per_page: int = 25
+    ) -> AccountSearchResponse:
+        matches = [
+            account for account in self.accounts
+            if query is None or query.lower() in f"{account.get('name')} {account.get('domain')}".lower()
+        ]
+        if label_ids:
+            matches = [account for account in matches if set(label_ids) & set(account.get("label_ids", ()))]
+        result = self._page(matches, page, per_page)
+        return AccountSearchResponse(accounts=result["items"], pagination=result["pagination"])
+
+    async def account_create(self, name: str, **fields) -> AccountCreateResponse:
+        account = {"id": self._new_id("account"), "name": name}
+        account.update((key, value) for key, value in fields.items() if value is not None)
+        self.accounts.append(account)
+        return AccountCreateResponse(account=account)
+
+    async def account_update(self, account_id: str, **fields) -> Optional[AccountUpdateResponse]:
+        account = self._account(account_id)
+        if account is None:
+            return None
+        account.update(fields)
+        return AccountUpdateResponse(account=account)
+
+    async def account_bulk_create(self, accounts: List[Dict]) -> AccountBulkCreateResponse:
+        created, existing = [], []
+        for item in accounts[:100]:
+            match = next((account for account in self.accounts if account.get("domain") == item.get("domain")), None)
+            if match is not None and item.get("domain"):
+                existing.append(match)
+            else:
+                created.append((await self.account_create(**item)).account)
+        return AccountBulkCreateResponse(created_accounts=created, existing_accounts=existing)
+
+    async def account_manage_lists(self, account_ids: List[str], label_name: str, operation: str = "add") -> Dict:
+        updated_accounts, found_ids, not_found_ids = [], [], []
+        for account_id in account_ids[:10]:
+            account = self._account(account_id)
+            if account is None:
+                not_found_ids.append(account_id)
+                continue
+            labels = [label for label in account.get("label_names", []) if label != label_name]
+            if operation == "add":
+                labels.append(label_name)
+            account["label_names"] = labels
+            updated_accounts.append(account)
+            found_ids.append(account_id)
+        return {
+            "updated_accounts": updated_accounts,
+            "found_ids": found_ids,
+            "not_found_ids": not_found_ids,
+            "total_requested": len(account_ids[:10])
+        }
+
+    async def account_add_to_list(self, account_ids: List[str], label_name: str) -> Dict:
+        return await self.account_manage_lists(account_ids, label_name, "add")
+
+    async def account_remove_from_list(self, account_ids: List[str], label_name: str) -> Dict:
+        return await self.account_manage_lists(account_ids, label_name, "remove")
@@ -7,14 +7,43 @@ This script validates the MCP server can:
 2. Load tools
 3. Handle basic queries
 4. Respond with proper error messages
+
+The checks are plain pytest tests, so they can be run (and sharded with
+pytest-xdist) by pytest, or standalone via `python test_mcp_integration.py`.
+Either way pytest must be installed (the `test` extra).
+Tool listing runs in-process; pass --e2e to list tools through `uv run` instead.
 """
 
+import functools
+import importlib.util
+import io
+import logging
 import os
 import sys
 import subprocess
+import threading
 import json
 from pathlib import Path
 
+import pytest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Repository root holding server.py (see ../.mcp.json.example)
+SERVER_DIR = Path(__file__).resolve().parents[4]
+
+# .mcp.json may be copied into this directory or the uv-project directory
+MCP_JSON_CANDIDATES = (
+    Path(__file__).parent / ".mcp.json",
+    Path(__file__).parent.parent / ".mcp.json",
+)
+
+# Tools that must appear in the list-tools output
+CORE_TOOLS = ("people_search", "organization_search")
+
 # Colors for output
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -22,30 +51,91 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
-def print_success(msg):
-    print(f"{GREEN}✓{RESET} {msg}")
+# Colored status prefixes, built once
+SUCCESS = f"{GREEN}✓{RESET} "
+ERROR = f"{RED}✗{RESET} "
+WARNING = f"{YELLOW}⚠{RESET} "
+INFO = f"{BLUE}ℹ{RESET} "
+RULE = "=" * 60
+
+# Status lines go through logging with lazy %-formatting. Under pytest they
+# reach pytest's log capture (INFO is dropped at the default WARNING level);
+# standalone runs buffer them and write stdout once via flush_output().
+log = logging.getLogger("apollo_tests")
+_OUT = io.StringIO()
+
+class StatusFormatter(logging.Formatter):
+    """Prefix each record with its colored status marker, if it has one."""
+
+    def format(self, record):
+        return getattr(record, "status", "") + super().format(record)
+
+def configure_output():
+    """Route status lines to the stdout buffer at INFO level (standalone runs)."""
+    handler = logging.StreamHandler(_OUT)
+    handler.setFormatter(StatusFormatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+def emit(msg="", *args):
+    log.info(msg, *args)
+
+def print_header(title):
+    log.info("\n%s\n%s\n%s", RULE, title, RULE)
 
-def print_error(msg):
-    print(f"{RED}✗{RESET} {msg}")
+def print_success(msg, *args):
+    log.info(msg, *args, extra={"status": SUCCESS})
 
-def print_warning(msg):
-    print(f"{YELLOW}⚠{RESET} {msg}")
+def print_error(msg, *args):
+    log.error(msg, *args, extra={"status": ERROR})
+
+def print_warning(msg, *args):
+    log.warning(msg, *args, extra={"status": WARNING})
+
+def print_info(msg, *args):
+    log.info(msg, *args, extra={"status": INFO})
+
+def flush_output():
+    """Write everything buffered so far to stdout."""
+    sys.stdout.write(_OUT.getvalue())
+    sys.stdout.flush()
+    _OUT.seek(0)
+    _OUT.truncate()
+
+
+@functools.lru_cache(maxsize=None)
+def load_server():
+    """Import the server module once per process (standalone runs; pytest uses
+    the session-scoped server_module fixture from tests/conftest.py)."""
+    if str(SERVER_DIR) not in sys.path:
+        sys.path.insert(0, str(SERVER_DIR))
+    import server
+    return server
+
+
+@pytest.fixture(scope="session")
+def e2e(request):
+    """Whether --e2e was passed to run checks against a real `uv run` process."""
+    return request.config.getoption("--e2e")
+
+
+@functools.lru_cache(maxsize=None)
+def get_api_key():
+    """Apollo API key from the environment, resolved once per process."""
+    return os.getenv('APOLLO_IO_API_KEY') or os.getenv('APOLLO_API_KEY')
 
-def print_info(msg):
-    print(f"{BLUE}ℹ{RESET} {msg}")
 
 def check_prerequisites():
     """Check all prerequisites are met"""
-    print("\n" + "="*60)
-    print("Checking Prerequisites")
-    print("="*60)
+    print_header("Checking Prerequisites")
 
     # Check Python version
     version = sys.version_info
     if version.major >= 3 and version.minor >= 10:
-        print_success(f"Python version: {version.major}.{version.minor}.{version.micro}")
+        print_success("Python version: %s.%s.%s", version.major, version.minor, version.micro)
     else:
-        print_error(f"Python version too old: {version.major}.{version.minor}.{version.micro}")
+        print_error("Python version too old: %s.%s.%s", version.major, version.minor, version.micro)
         print_error("Requires Python 3.10+")
         return False
 
@@ -53,7 +143,7 @@ def check_prerequisites():
     try:
         result = subprocess.run(['uv', '--version'], capture_output=True, text=True)
         if result.returncode == 0:
-            print_success(f"uv installed: {result.stdout.strip()}")
+            print_success("uv installed: %s", result.stdout.strip())
         else:
             print_error("uv is not installed")
             return False
@@ -63,222 +153,216 @@ def check_prerequisites():
         return False
 
     # Check API key is set
-    api_key = os.getenv('APOLLO_IO_API_KEY') or os.getenv('APOLLO_API_KEY')
+    api_key = get_api_key()
     if api_key:
         masked_key = api_key[:8] + "..." + api_key[-4:] if len(api_key) > 12 else "***"
-        print_success(f"API key found: {masked_key}")
+        print_success("API key found: %s", masked_key)
     else:
         print_error("APOLLO_IO_API_KEY not set")
         print_info("Set with: export APOLLO_IO_API_KEY='your_key'")
         return False
 
     # Check project structure
-    parent_dir = Path(__file__).parent.parent
-    server_py = parent_dir / "server.py"
+    server_py = SERVER_DIR / "server.py"
     if server_py.exists():
-        print_success(f"server.py found at: {server_py}")
+        print_success("server.py found at: %s", server_py)
     else:
-        print_error(f"server.py not found at: {server_py}")
+        print_error("server.py not found at: %s", server_py)
         return False
 
     return True
 
-def test_server_list_tools():
+def stream_list_tools(timeout=30):
+    """
+    Run `list-tools` through `uv run`, reading stdout as it arrives.
+
+    Stops the process as soon as every core tool has been printed, so that
+    counts as success. stderr is merged into stdout, so a chatty server
+    cannot fill an unread pipe and stall. Returns (exit_code, output, errors).
+    """
+    proc = subprocess.Popen(
+        ['uv', 'run', '--directory', str(SERVER_DIR), 'python', 'server.py', 'list-tools'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
+    )
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        proc.kill()
+
+    # Killing the process closes its stdout, which ends the read loop
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    lines, missing = [], set(CORE_TOOLS)
+    try:
+        for line in proc.stdout:
+            lines.append(line)
+            missing = {tool for tool in missing if tool not in line}
+            if not missing:
+                proc.terminate()
+                break
+        proc.wait()
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        pytest.fail(f"Server timed out ({timeout}s)")
+    output = "".join(lines)
+    return (0 if not missing else proc.returncode), output, output
+
+def test_server_list_tools(server_module, e2e):
     """Test that server can list tools"""
-    print("\n" + "="*60)
-    print("Testing Tool Listing")
-    print("="*60)
+    print_header("Testing Tool Listing")
 
-    parent_dir = Path(__file__).parent.parent
+    if e2e:
+        # End-to-end: resolve the environment and start a fresh interpreter
+        exit_code, output, errors = stream_list_tools()
+    else:
+        # Invoke the Typer command on the already-imported module
+        from typer.testing import CliRunner
+        result = CliRunner().invoke(server_module.app, ["list-tools"])
+        exit_code, output, errors = result.exit_code, result.stdout, result.output
 
-    try:
-        result = subprocess.run(
-            ['uv', 'run', '--directory', str(parent_dir), 'python', 'server.py', 'list-tools'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+    assert exit_code == 0, f"Server failed to list tools: {errors}"
+    print_success("Server listed tools successfully")
 
-        if result.returncode == 0:
-            print_success("Server listed tools successfully")
-
-            # Count tools in output
-            output = result.stdout
-            if 'people_search' in output and 'organization_search' in output:
-                print_success("Core tools found in output")
-                print_info(f"Output preview:\n{output[:500]}")
-                return True
-            else:
-                print_error("Expected tools not found in output")
-                return False
-        else:
-            print_error("Server failed to list tools")
-            print_error(f"Error: {result.stderr}")
-            return False
+    # Check core tools are in the output
+    assert all(tool in output for tool in CORE_TOOLS), "Expected tools not found in output"
+    print_success("Core tools found in output")
+    print_info("Output preview:\n%s", output[:500])
 
-    except subprocess.TimeoutExpired:
-        print_error("Server timed out (30s)")
-        return False
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        return False
+def load_json(path):
+    """Parse a JSON file straight from bytes, with orjson when it's installed."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 def test_mcp_json_config():
     """Test that .mcp.json is valid"""
-    print("\n" + "="*60)
-    print("Testing .mcp.json Configuration")
-    print("="*60)
+    print_header("Testing .mcp.json Configuration")
 
-    mcp_json_path = Path(__file__).parent / ".mcp.json"
-
-    if not mcp_json_path.exists():
-        print_error(f".mcp.json not found at: {mcp_json_path}")
-        return False
+    mcp_json_path = next((path for path in MCP_JSON_CANDIDATES if path.exists()), None)
+    if mcp_json_path is None:
+        pytest.skip(".mcp.json not found (copy .mcp.json.example to create it)")
 
     try:
-        with open(mcp_json_path) as f:
-            config = json.load(f)
-
-        print_success(".mcp.json is valid JSON")
-
-        # Check structure
-        if 'mcpServers' in config:
-            print_success("mcpServers key found")
-
-            servers = config['mcpServers']
-            if servers:
-                print_success(f"Found {len(servers)} server(s) configured")
-                for name, server_config in servers.items():
-                    print_info(f"  - {name}")
-                    if 'command' in server_config:
-                        print_success(f"    Command: {server_config['command']}")
-                    if 'env' in server_config and 'APOLLO_IO_API_KEY' in server_config['env']:
-                        print_success(f"    API key configured")
-                return True
-            else:
-                print_error("No servers configured")
-                return False
-        else:
-            print_error("mcpServers key not found")
-            return False
-
-    except json.JSONDecodeError as e:
-        print_error(f"Invalid JSON: {e}")
-        return False
-    except Exception as e:
-        print_error(f"Error reading .mcp.json: {e}")
-        return False
-
-def test_server_startup():
+        config = load_json(mcp_json_path)
+    except json.JSONDecodeError as e:  # orjson's error subclasses this too
+        pytest.fail(f"Invalid JSON: {e}")
+    print_success(".mcp.json is valid JSON")
+
+    # Check structure
+    assert 'mcpServers' in config, "mcpServers key not found"
+    print_success("mcpServers key found")
+
+    servers = config['mcpServers']
+    assert servers, "No servers configured"
+    print_success("Found %d server(s) configured", len(servers))
+    for name, server_config in servers.items():
+        print_info("  - %s", name)
+        if 'command' in server_config:
+            print_success("    Command: %s", server_config['command'])
+        if 'env' in server_config and 'APOLLO_IO_API_KEY' in server_config['env']:
+            print_success("    API key configured")
+
+def test_server_startup(server_module):
     """Test that server can start (quick startup test)"""
-    print("\n" + "="*60)
-    print("Testing Server Startup")
-    print("="*60)
-
-    parent_dir = Path(__file__).parent.parent
-
-    # Try to import server module to check for syntax errors
+    print_header("Testing Server Startup")
+
+    print_success("Server module imports without errors")
+
+    # Check key components exist
+    assert hasattr(server_module, 'app'), "Typer app not found"
+    print_success("Typer app found")
+    assert hasattr(server_module, 'mcp'), "FastMCP instance not found"
+    print_success("FastMCP instance found")
+
+@pytest.mark.parametrize("package, package_name", [
+    ('mcp', 'mcp'),
+    ('httpx', 'httpx'),
+    ('pydantic', 'pydantic'),
+    ('dotenv', 'python-dotenv'),
+    ('typer', 'typer'),
+])
+def test_dependencies(package, package_name):
+    """Test that a required dependency is available"""
+    # find_spec locates the package without executing it
+    if importlib.util.find_spec(package) is None:
+        pytest.fail(f"{package_name} is not installed")
+    print_success("%s is installed", package_name)
+
+def run_check(test_func, *args):
+    """Run one check outside pytest, mapping assertions, skips and crashes to a result."""
     try:
-        sys.path.insert(0, str(parent_dir))
-        import server
-        print_success("Server module imports without errors")
-
-        # Check key components exist
-        if hasattr(server, 'app'):
-            print_success("Typer app found")
-        if hasattr(server, 'mcp'):
-            print_success("FastMCP instance found")
-
+        result = test_func(*args)
+    except pytest.skip.Exception as e:
+        print_warning("Skipped: %s", e)
         return True
-
-    except ImportError as e:
-        print_error(f"Failed to import server: {e}")
+    except (AssertionError, pytest.fail.Exception) as e:
+        print_error("%s", e)
         return False
     except Exception as e:
-        print_error(f"Error loading server: {e}")
+        print_error("Check crashed: %s", e)
         return False
+    return result is not False
 
-def test_dependencies():
-    """Test that all required dependencies are available"""
-    print("\n" + "="*60)
-    print("Testing Dependencies")
-    print("="*60)
-
-    required_packages = [
-        'mcp',
-        'httpx',
-        'pydantic',
-        'dotenv',
-        'typer',
-    ]
+def excepthook(exc_type, exc, tb):
+    """Last resort for errors outside the checks: one red line, no traceback."""
+    sys.stderr.write(f"{RED}✗ Integration checks crashed: {exc_type.__name__}: {exc}{RESET}\n")
 
-    all_ok = True
-    for package in required_packages:
-        try:
-            if package == 'dotenv':
-                __import__('dotenv')
-                package_name = 'python-dotenv'
-            else:
-                __import__(package)
-                package_name = package
-            print_success(f"{package_name} is installed")
-        except ImportError:
-            print_error(f"{package_name} is not installed")
-            all_ok = False
-
-    return all_ok
+def check_dependencies():
+    """Check every required dependency, as the parametrized test does"""
+    print_header("Testing Dependencies")
+
+    params = test_dependencies.pytestmark[0].args[1]
+    return all([run_check(test_dependencies, *param) for param in params])
 
 def main():
     """Run all tests"""
-    print("\n" + "="*60)
-    print("Apollo.io MCP Server Integration Tests")
-    print("="*60)
+    configure_output()
+    print_header("Apollo.io MCP Server Integration Tests")
 
     tests = [
         ("Prerequisites", check_prerequisites),
-        ("Dependencies", test_dependencies),
+        ("Dependencies", check_dependencies),
         (".mcp.json Config", test_mcp_json_config),
-        ("Server Startup", test_server_startup),
-        ("Tool Listing", test_server_list_tools),
+        ("Server Startup", lambda: test_server_startup(load_server())),
+        ("Tool Listing", lambda: test_server_list_tools(load_server(), "--e2e" in sys.argv)),
     ]
 
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print_error(f"Test '{test_name}' crashed: {e}")
-            results.append((test_name, False))
+    results = [(test_name, run_check(test_func)) for test_name, test_func in tests]
 
     # Summary
-    print("\n" + "="*60)
-    print("Test Summary")
-    print("="*60)
+    print_header("Test Summary")
 
     passed = sum(1 for _, result in results if result)
     total = len(results)
 
     for test_name, result in results:
         if result:
-            print_success(f"{test_name}")
+            print_success("%s", test_name)
         else:
-            print_error(f"{test_name}")
+            print_error("%s", test_name)
 
-    print("\n" + "-"*60)
+    emit("\n%s", "-"*60)
     if passed == total:
-        print_success(f"All tests passed ({passed}/{total})")
-        print("\n" + GREEN + "✓ MCP Server is ready to use!" + RESET)
-        print("\nNext steps:")
-        print("  1. Open this directory in Claude Code")
-        print("  2. Check MCP server status (should show connected)")
-        print("  3. Try test queries from README.md")
+        print_success("All tests passed (%d/%d)", passed, total)
+        emit("\n%s✓ MCP Server is ready to use!%s", GREEN, RESET)
+        emit("\nNext steps:")
+        emit("  1. Open this directory in Claude Code")
+        emit("  2. Check MCP server status (should show connected)")
+        emit("  3. Try test queries from README.md")
         return 0
     else:
-        print_error(f"Some tests failed ({passed}/{total} passed)")
-        print("\n" + RED + "✗ MCP Server has issues" + RESET)
-        print("\nReview the errors above and fix them before proceeding.")
+        print_error("Some tests failed (%d/%d passed)", passed, total)
+        emit("\n%s✗ MCP Server has issues%s", RED, RESET)
+        emit("\nReview the errors above and fix them before proceeding.")
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.excepthook = excepthook
+    try:
+        sys.exit(main())
+    finally:
+        flush_output()
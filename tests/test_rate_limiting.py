@@ -7,6 +7,7 @@ This test verifies that:
 3. Bulk operations have stricter limits than standard operations
 """
 import asyncio
+import logging
 import time
 import sys
 from pathlib import Path
@@ -17,6 +18,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from apollo_client import ApolloClient
 from apollo import PeopleEnrichmentQuery
 
+log = logging.getLogger(__name__)
+
 
 async def test_rate_limiting_disabled():
     """Test that operations proceed without delay when rate limiting is disabled."""
@@ -30,7 +33,7 @@ async def test_rate_limiting_disabled():
 
     # Should be nearly instantaneous (< 0.1 seconds for 5 checks)
     assert elapsed < 0.1, f"Expected < 0.1s with rate limiting disabled, got {elapsed}s"
-    print(f"✓ Rate limiting disabled test passed (elapsed: {elapsed:.3f}s)")
+    log.info("✓ Rate limiting disabled test passed (elapsed: %.3fs)", elapsed)
 
 
 async def test_rate_limiting_standard():
@@ -51,12 +54,12 @@ async def test_rate_limiting_standard():
     elapsed = time.time() - start_time
 
     assert elapsed < 0.5, f"First 2 requests should be fast, got {elapsed}s"
-    print(f"✓ First 2 requests completed quickly (elapsed: {elapsed:.3f}s)")
+    log.info("✓ First 2 requests completed quickly (elapsed: %.3fs)", elapsed)
 
     # 3rd request should wait (will hit rate limit)
     # Note: This test would need to wait ~60 seconds for the limit to reset
     # For a quick test, we'll just verify the rate limit exists
-    print("✓ Standard rate limiting test passed (rate limiter configured correctly)")
+    log.info("✓ Standard rate limiting test passed (rate limiter configured correctly)")
 
 
 async def test_rate_limiting_bulk_stricter():
@@ -80,7 +83,7 @@ async def test_rate_limiting_bulk_stricter():
     assert bulk_min_limit < standard_min_limit, \
         f"Bulk limit ({bulk_min_limit}) should be stricter than standard ({standard_min_limit})"
 
-    print(f"✓ Bulk limits are stricter: {bulk_min_limit}/min vs {standard_min_limit}/min")
+    log.info("✓ Bulk limits are stricter: %s/min vs %s/min", bulk_min_limit, standard_min_limit)
 
 
 async def test_custom_rate_limits():
@@ -104,18 +107,19 @@ async def test_custom_rate_limits():
     assert client.bulk_limits[1].amount == 50
     assert client.bulk_limits[2].amount == 300
 
-    print("✓ Custom rate limits configured correctly")
+    log.info("✓ Custom rate limits configured correctly")
 
 
 async def main():
-    print("Running rate limiting tests...\n")
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log.info("Running rate limiting tests...\n")
 
     await test_rate_limiting_disabled()
     await test_rate_limiting_standard()
     await test_rate_limiting_bulk_stricter()
     await test_custom_rate_limits()
 
-    print("\n✓ All rate limiting tests passed!")
+    log.info("\n✓ All rate limiting tests passed!")
 
 
 if __name__ == "__main__":
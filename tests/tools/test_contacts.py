@@ -16,11 +16,14 @@ To run these tests:
 
 By default, these tests are skipped (see pyproject.toml).
 """
+import logging
 import pytest
 import vcr
 import json
 from server import mcp
 
+log = logging.getLogger(__name__)
+
 
 def parse_mcp_response(result):
     """
@@ -109,7 +112,7 @@ async def test_mcp_contact_list_management_workflow():
         contact2_id = created[1]["id"]
         contact3_id = created[2]["id"]
 
-        print(f"\n✓ Created 3 test contacts: {contact1_id}, {contact2_id}, {contact3_id}")
+        log.info("\n✓ Created 3 test contacts: %s, %s, %s", contact1_id, contact2_id, contact3_id)
 
         # Wait a moment for contacts to be fully indexed
         import asyncio
@@ -134,7 +137,7 @@ async def test_mcp_contact_list_management_workflow():
             assert "List A Test" in contact["label_names"], \
                 f"Contact {contact['id']} should have 'List A Test' label"
 
-        print(f"✓ Added contacts 1 and 2 to 'List A Test'")
+        log.info("✓ Added contacts 1 and 2 to 'List A Test'")
 
         # STEP 3: Remove contact 2 from "List A" (contact 1 should remain)
         remove_from_list_a_result = parse_mcp_response(await mcp.call_tool(
@@ -154,7 +157,7 @@ async def test_mcp_contact_list_management_workflow():
         assert "List A Test" not in removed_contact.get("label_names", []), \
             "Contact 2 should not have 'List A Test' label after removal"
 
-        print(f"✓ Removed contact 2 from 'List A Test'")
+        log.info("✓ Removed contact 2 from 'List A Test'")
 
         # STEP 4: Add all three contacts to "List B"
         add_to_list_b_result = parse_mcp_response(await mcp.call_tool(
@@ -176,7 +179,7 @@ async def test_mcp_contact_list_management_workflow():
             assert "List B Test" in contact["label_names"], \
                 f"Contact {contact['id']} should have 'List B Test' label"
 
-        print(f"✓ Added all 3 contacts to 'List B Test'")
+        log.info("✓ Added all 3 contacts to 'List B Test'")
 
         # STEP 5: Validate final state based on helper responses
         # Contact 1 should have both "List A Test" and "List B Test"
@@ -195,7 +198,7 @@ async def test_mcp_contact_list_management_workflow():
             "Contact 1 should have 'List B Test' label"
         assert "Test Baseline" in contact_labels[contact1_id], \
             "Contact 1 should have 'Test Baseline' label"
-        print(f"✓ Contact 1 has 'Test Baseline', 'List A Test', and 'List B Test' labels")
+        log.info("✓ Contact 1 has 'Test Baseline', 'List A Test', and 'List B Test' labels")
 
         # Validate Contact 2: Should have Test Baseline and List B (removed from List A)
         assert "List A Test" not in contact_labels[contact2_id], \
@@ -204,7 +207,7 @@ async def test_mcp_contact_list_management_workflow():
             "Contact 2 should have 'List B Test' label"
         assert "Test Baseline" in contact_labels[contact2_id], \
             "Contact 2 should have 'Test Baseline' label"
-        print(f"✓ Contact 2 has 'Test Baseline' and 'List B Test' labels (List A was removed)")
+        log.info("✓ Contact 2 has 'Test Baseline' and 'List B Test' labels (List A was removed)")
 
         # Validate Contact 3: Should have Test Baseline and List B (never added to List A)
         assert "List A Test" not in contact_labels[contact3_id], \
@@ -213,9 +216,9 @@ async def test_mcp_contact_list_management_workflow():
             "Contact 3 should have 'List B Test' label"
         assert "Test Baseline" in contact_labels[contact3_id], \
             "Contact 3 should have 'Test Baseline' label"
-        print(f"✓ Contact 3 has 'Test Baseline' and 'List B Test' labels (never added to List A)")
+        log.info("✓ Contact 3 has 'Test Baseline' and 'List B Test' labels (never added to List A)")
 
-        print("\n✓ Complete workflow validated successfully!")
-        print(f"  - Contact 1: {sorted(contact_labels[contact1_id])}")
-        print(f"  - Contact 2: {sorted(contact_labels[contact2_id])}")
-        print(f"  - Contact 3: {sorted(contact_labels[contact3_id])}")
+        log.info("\n✓ Complete workflow validated successfully!")
+        log.info("  - Contact 1: %s", sorted(contact_labels[contact1_id]))
+        log.info("  - Contact 2: %s", sorted(contact_labels[contact2_id]))
+        log.info("  - Contact 3: %s", sorted(contact_labels[contact3_id]))
@@ -6,16 +6,8 @@ They run by default without requiring API credentials.
 """
 import pytest
 import respx
-from httpx import Response
 from apollo_client import ApolloClient
-from tests.fixtures import (
-    ACCOUNTS_SEARCH_NO_RESULTS,
-    ACCOUNTS_SEARCH_WITH_RESULTS,
-    ACCOUNT_CREATE_RESPONSE,
-    ACCOUNT_UPDATE_RESPONSE,
-    ACCOUNT_BULK_CREATE_RESPONSE,
-    ACCOUNT_BULK_UPDATE_RESPONSE,
-)
+from tests.fixtures import mock_response
 
 
 @respx.mock
@@ -27,7 +19,7 @@ async def test_account_search_no_results_unit():
     """
     # Mock the API response
     respx.get("https://api.apollo.io/api/v1/accounts/search").mock(
-        return_value=Response(200, json=ACCOUNTS_SEARCH_NO_RESULTS)
+        return_value=mock_response("ACCOUNTS_SEARCH_NO_RESULTS")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -60,7 +52,7 @@ async def test_account_search_with_results_unit():
     """
     # Mock the API response
     respx.get("https://api.apollo.io/api/v1/accounts/search").mock(
-        return_value=Response(200, json=ACCOUNTS_SEARCH_WITH_RESULTS)
+        return_value=mock_response("ACCOUNTS_SEARCH_WITH_RESULTS")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -100,7 +92,7 @@ async def test_account_create_unit():
     """
     # Mock the API response
     respx.post("https://api.apollo.io/api/v1/accounts").mock(
-        return_value=Response(200, json=ACCOUNT_CREATE_RESPONSE)
+        return_value=mock_response("ACCOUNT_CREATE_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -131,7 +123,7 @@ async def test_account_update_unit():
     """
     # Mock the API response
     respx.patch("https://api.apollo.io/api/v1/accounts/account_123").mock(
-        return_value=Response(200, json=ACCOUNT_UPDATE_RESPONSE)
+        return_value=mock_response("ACCOUNT_UPDATE_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -160,7 +152,7 @@ async def test_account_bulk_create_unit():
     """
     # Mock the API response
     respx.post("https://api.apollo.io/api/v1/accounts/bulk_create").mock(
-        return_value=Response(200, json=ACCOUNT_BULK_CREATE_RESPONSE)
+        return_value=mock_response("ACCOUNT_BULK_CREATE_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -193,7 +185,7 @@ async def test_account_bulk_update_unit():
     """
     # Mock the API response
     respx.post("https://api.apollo.io/api/v1/accounts/bulk_update").mock(
-        return_value=Response(200, json=ACCOUNT_BULK_UPDATE_RESPONSE)
+        return_value=mock_response("ACCOUNT_BULK_UPDATE_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
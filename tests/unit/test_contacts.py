@@ -4,19 +4,14 @@ Unit tests for Apollo.io contact operations using mocked responses.
 These tests use respx to mock httpx requests and anonymized fixtures.
 They run by default without requiring API credentials.
 """
+import asyncio
+import json
 import pytest
 import respx
 from httpx import Response
 from apollo_client import ApolloClient
-from tests.fixtures import (
-    CONTACTS_SEARCH_NO_RESULTS,
-    CONTACTS_SEARCH_WITH_RESULTS,
-    CONTACT_CREATE_RESPONSE,
-    CONTACT_UPDATE_RESPONSE,
-    CONTACT_BULK_CREATE_RESPONSE,
-    CONTACT_BULK_UPDATE_RESPONSE,
-    USAGE_STATS_RESPONSE,
-)
+from tests.fixtures import mock_response
+
 
 
 @respx.mock
@@ -28,7 +23,7 @@ async def test_contact_search_no_results_unit():
     """
     # Mock the API response
     respx.get("https://api.apollo.io/api/v1/contacts/search").mock(
-        return_value=Response(200, json=CONTACTS_SEARCH_NO_RESULTS)
+        return_value=mock_response("CONTACTS_SEARCH_NO_RESULTS")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -61,7 +56,7 @@ async def test_contact_search_with_results_unit():
     """
     # Mock the API response
     respx.get("https://api.apollo.io/api/v1/contacts/search").mock(
-        return_value=Response(200, json=CONTACTS_SEARCH_WITH_RESULTS)
+        return_value=mock_response("CONTACTS_SEARCH_WITH_RESULTS")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -107,7 +102,7 @@ async def test_contact_create_unit():
     """
     # Mock the API response
     respx.post("https://api.apollo.io/api/v1/contacts").mock(
-        return_value=Response(200, json=CONTACT_CREATE_RESPONSE)
+        return_value=mock_response("CONTACT_CREATE_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -150,7 +145,7 @@ async def test_contact_update_unit():
 
     # Mock the API response
     respx.put(f"https://api.apollo.io/api/v1/contacts/{contact_id}").mock(
-        return_value=Response(200, json=CONTACT_UPDATE_RESPONSE)
+        return_value=mock_response("CONTACT_UPDATE_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -188,7 +183,7 @@ async def test_contact_search_pagination_unit():
     """
     # Mock the API response
     respx.get("https://api.apollo.io/api/v1/contacts/search").mock(
-        return_value=Response(200, json=CONTACTS_SEARCH_WITH_RESULTS)
+        return_value=mock_response("CONTACTS_SEARCH_WITH_RESULTS")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -216,6 +211,34 @@ async def test_contact_search_pagination_unit():
     assert pagination.total_pages == 9
 
 
+@respx.mock
+async def test_contact_search_stream_unit():
+    """
+    Test streaming contacts across pages (unit test with mocked responses).
+
+    Validates that the generator walks pages until a short page is returned.
+    """
+    page_one = {
+        "contacts": [{"id": "contact_1"}, {"id": "contact_2"}],
+        "pagination": {"page": 1, "per_page": 2, "total_entries": 3, "total_pages": 2}
+    }
+    page_two = {
+        "contacts": [{"id": "contact_3"}],
+        "pagination": {"page": 2, "per_page": 2, "total_entries": 3, "total_pages": 2}
+    }
+    route = respx.get("https://api.apollo.io/api/v1/contacts/search").mock(
+        side_effect=[Response(200, json=page_one), Response(200, json=page_two)]
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+
+    ids = [contact["id"] async for contact in client.contact_search_stream(query="test", per_page=2)]
+
+    assert ids == ["contact_1", "contact_2", "contact_3"]
+    assert route.call_count == 2
+    assert route.calls[1].request.url.params["page"] == "2"
+
+
 @respx.mock
 async def test_contact_bulk_create_unit():
     """
@@ -226,7 +249,7 @@ async def test_contact_bulk_create_unit():
     """
     # Mock the API response
     respx.post("https://api.apollo.io/api/v1/contacts/bulk_create").mock(
-        return_value=Response(200, json=CONTACT_BULK_CREATE_RESPONSE)
+        return_value=mock_response("CONTACT_BULK_CREATE_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -278,6 +301,29 @@ async def test_contact_bulk_create_unit():
     assert result.existing_contacts[0].get('email') == 'jane.doe@example.com'
 
 
+@respx.mock
+async def test_contact_bulk_create_caps_at_100_unit():
+    """
+    Test that bulk create sends at most 100 contacts per request.
+    """
+    contacts = [
+        {"id": f"bulk_created_{i}", "first_name": "Bulk", "last_name": f"Contact {i}", "email": f"user{i}@example.com"}
+        for i in range(1, 151)
+    ]
+    route = respx.post("https://api.apollo.io/api/v1/contacts/bulk_create").mock(
+        return_value=Response(200, json={"created_contacts": contacts[:100], "existing_contacts": []})
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+
+    result = await client.contact_bulk_create(contacts=contacts)
+
+    sent = json.loads(route.calls[0].request.content)["contacts"]
+    assert len(sent) == 100
+    assert sent[-1]["id"] == "bulk_created_100"
+    assert len(result.created_contacts) == 100
+
+
 @respx.mock
 async def test_contact_bulk_update_unit():
     """
@@ -288,7 +334,7 @@ async def test_contact_bulk_update_unit():
     """
     # Mock the API response
     respx.post("https://api.apollo.io/api/v1/contacts/bulk_update").mock(
-        return_value=Response(200, json=CONTACT_BULK_UPDATE_RESPONSE)
+        return_value=mock_response("CONTACT_BULK_UPDATE_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -337,7 +383,7 @@ async def test_usage_stats_unit():
     """
     # Mock the API response
     respx.post("https://api.apollo.io/api/v1/usage_stats/api_usage_stats").mock(
-        return_value=Response(200, json=USAGE_STATS_RESPONSE)
+        return_value=mock_response("USAGE_STATS_RESPONSE")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -373,3 +419,48 @@ async def test_usage_stats_unit():
     assert bulk_create_stats["hour"]["limit"] == 100
     assert bulk_create_stats["hour"]["consumed"] == 15
     assert bulk_create_stats["hour"]["left_over"] == 85
+
+
+@respx.mock
+async def test_usage_stats_raw_unit(usage_stats_response):
+    """
+    Test retrieving usage statistics as the decoded JSON dict (raw=True).
+
+    Validates that raw mode skips model construction but keeps every endpoint.
+    """
+    respx.post("https://api.apollo.io/api/v1/usage_stats/api_usage_stats").mock(
+        return_value=mock_response("USAGE_STATS_RESPONSE")
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+
+    result = await client.usage_stats(raw=True)
+
+    assert isinstance(result, dict)
+    assert result == usage_stats_response
+
+
+@respx.mock
+async def test_contact_search_coalesced_unit():
+    """
+    Test that identical concurrent contact searches share one HTTP request.
+
+    Validates that every caller receives the result and the in-flight entry is cleared.
+    """
+    route = respx.get("https://api.apollo.io/api/v1/contacts/search").mock(
+        return_value=mock_response("CONTACTS_SEARCH_WITH_RESULTS")
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+
+    results = await asyncio.gather(*(
+        client.contact_search(query="test", page=1, per_page=10) for _ in range(3)
+    ))
+
+    assert route.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert client._in_flight == {}
+
+    # A later identical call is not coalesced with the finished one
+    await client.contact_search(query="test", page=1, per_page=10)
+    assert route.call_count == 2
@@ -8,11 +8,7 @@ import pytest
 import respx
 from httpx import Response
 from apollo_client import ApolloClient
-from tests.fixtures import (
-    LABELS_LIST_ALL,
-    LABELS_LIST_CONTACTS,
-    LABELS_LIST_ACCOUNTS,
-)
+from tests.fixtures import LABELS_LIST_ALL, mock_response, mutable
 
 
 @respx.mock
@@ -24,7 +20,7 @@ async def test_labels_list_all_unit():
     """
     # Mock the API response - API returns array directly
     respx.get("https://api.apollo.io/api/v1/labels").mock(
-        return_value=Response(200, json=LABELS_LIST_ALL)
+        return_value=mock_response("LABELS_LIST_ALL")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -63,7 +59,7 @@ async def test_labels_list_contacts_only_unit():
     """
     # Mock the API response - API returns all labels
     respx.get("https://api.apollo.io/api/v1/labels").mock(
-        return_value=Response(200, json=LABELS_LIST_ALL)
+        return_value=mock_response("LABELS_LIST_ALL")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -96,7 +92,7 @@ async def test_labels_list_accounts_only_unit():
     """
     # Mock the API response - API returns all labels
     respx.get("https://api.apollo.io/api/v1/labels").mock(
-        return_value=Response(200, json=LABELS_LIST_ALL)
+        return_value=mock_response("LABELS_LIST_ALL")
     )
 
     client = ApolloClient(api_key="test_api_key")
@@ -171,6 +167,63 @@ async def test_labels_list_error_unit():
     assert result is None
 
 
+@respx.mock
+async def test_labels_list_cached_unit():
+    """
+    Test that repeated label lookups are served from the client cache.
+
+    Validates that a different modality is a separate cache entry and that
+    clear_cache forces a fresh request.
+    """
+    route = respx.get("https://api.apollo.io/api/v1/labels").mock(
+        return_value=mock_response("LABELS_LIST_ALL")
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+
+    first = await client.labels_list()
+    second = await client.labels_list()
+    assert second is first
+    assert route.call_count == 1
+
+    await client.labels_list(modality="contacts")
+    assert route.call_count == 2
+
+    client.clear_cache()
+    await client.labels_list()
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_labels_list_after_write_unit():
+    """
+    Test that a write with label_names drops the cached label list.
+
+    Apollo creates missing labels on the fly, so listing right after a
+    contact_create into a new list must see that list.
+    """
+    labels = mutable(LABELS_LIST_ALL)
+    new_label = {**labels[0], "id": "label_new", "name": "New Prospects"}
+    route = respx.get("https://api.apollo.io/api/v1/labels").mock(side_effect=[
+        Response(200, json=labels),
+        Response(200, json=[*labels, new_label]),
+    ])
+    respx.post("https://api.apollo.io/api/v1/contacts").mock(
+        return_value=mock_response("CONTACT_CREATE_RESPONSE")
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+
+    before = await client.labels_list(modality="contacts")
+    assert "New Prospects" not in [label.name for label in before.labels]
+
+    await client.contact_create(first_name="Test", last_name="Contact", label_names=["New Prospects"])
+
+    after = await client.labels_list(modality="contacts")
+    assert route.call_count == 2
+    assert "New Prospects" in [label.name for label in after.labels]
+
+
 @respx.mock
 async def test_labels_response_fields_unit():
     """
@@ -180,7 +233,7 @@ async def test_labels_response_fields_unit():
     """
     # Mock the API response
     respx.get("https://api.apollo.io/api/v1/labels").mock(
-        return_value=Response(200, json=LABELS_LIST_ALL)
+        return_value=mock_response("LABELS_LIST_ALL")
     )
 
     client = ApolloClient(api_key="test_api_key")
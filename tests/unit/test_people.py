@@ -1,9 +1,12 @@
 """Unit tests for Apollo.io people operations using mocked responses."""
 import pytest
 import respx
+import asyncio
+import json
+import httpx
 from httpx import Response
 from apollo_client import ApolloClient
-from apollo import PeopleEnrichmentQuery, PeopleSearchQuery
+from apollo import PeopleEnrichmentQuery, PeopleSearchQuery, BulkPeopleEnrichmentQuery
 
 
 @pytest.mark.skip(reason="Complex Person model requires full mock data")
@@ -31,3 +34,160 @@ async def test_people_search_unit():
 
     assert result is not None
     assert result.pagination.page == 1
+
+
+def person(person_id):
+    """Minimal Person payload as returned in bulk_match matches."""
+    return {
+        "id": person_id, "first_name": "Test", "last_name": person_id, "name": f"Test {person_id}",
+        "headline": None, "email": None, "organization_id": None, "employment_history": [],
+        "revealed_for_current_team": False, "show_intent": False,
+        "departments": [], "subdepartments": [], "functions": [], "seniority": None,
+    }
+
+
+@respx.mock
+async def test_people_bulk_enrichment_many_unit():
+    """Test that bulk enrichment is sharded into batches of 10, retried once on failure and merged."""
+    def bulk_match(request):
+        details = json.loads(request.content)["details"]
+        if details[0]["id"] == "p10":
+            return Response(500, text="Internal Server Error")
+        matches = [person(detail["id"]) for detail in details]
+        if details[0]["id"] == "p20":
+            # The same person matched in two shards is merged once
+            matches.append(person("p0"))
+        return Response(200, json={
+            "status": "success",
+            "total_requested_enrichments": len(details),
+            "unique_enriched_records": len(matches),
+            "missing_records": 0,
+            "credits_consumed": len(details),
+            "matches": matches
+        })
+
+    route = respx.post("https://api.apollo.io/api/v1/people/bulk_match").mock(side_effect=bulk_match)
+
+    client = ApolloClient(api_key="test_api_key")
+    details = [{"id": f"p{i}"} for i in range(25)]
+    result = await client.people_bulk_enrichment_many(BulkPeopleEnrichmentQuery(details=details))
+
+    assert route.call_count == 4
+    assert result.status == "success"
+    assert result.total_requested_enrichments == 25
+    assert result.unique_enriched_records == len(result.matches) == 15
+    assert result.missing_records == 10
+    assert result.credits_consumed == 15
+
+
+@respx.mock
+async def test_people_bulk_enrichment_many_retry_unit():
+    """Test that a shard failing once is recovered by the retry."""
+    responses = iter([
+        Response(200, json={"status": "success", "total_requested_enrichments": 10, "matches": []}),
+        Response(503, text="Service Unavailable"),
+        Response(200, json={"status": "success", "total_requested_enrichments": 5, "matches": []}),
+    ])
+    route = respx.post("https://api.apollo.io/api/v1/people/bulk_match").mock(
+        side_effect=lambda request: next(responses)
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+    details = [{"id": f"p{i}"} for i in range(15)]
+    result = await client.people_bulk_enrichment_many(BulkPeopleEnrichmentQuery(details=details))
+
+    assert route.call_count == 3
+    assert result.total_requested_enrichments == 15
+    assert result.missing_records == 0
+
+
+@respx.mock
+async def test_people_bulk_enrichment_stream_unit():
+    """Test that bulk enrichment shards are yielded one response at a time."""
+    respx.post("https://api.apollo.io/api/v1/people/bulk_match").mock(
+        return_value=Response(200, json={"status": "success", "matches": []})
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+    details = [{"id": f"p{i}"} for i in range(25)]
+    shard_sizes = []
+    async for shard, result in client.people_bulk_enrichment_stream(BulkPeopleEnrichmentQuery(details=details)):
+        assert result.status == "success"
+        shard_sizes.append(len(shard.details))
+
+    assert sorted(shard_sizes) == [5, 10, 10]
+
+
+@respx.mock
+async def test_people_bulk_enrichment_many_connect_error_unit():
+    """Test that a shard whose request raises is counted as missing, keeping the other shards."""
+    def bulk_match(request):
+        details = json.loads(request.content)["details"]
+        if details[0]["id"] == "p10":
+            raise httpx.ConnectError("connection reset")
+        return Response(200, json={
+            "status": "success",
+            "total_requested_enrichments": len(details),
+            "unique_enriched_records": len(details),
+            "missing_records": 0,
+            "credits_consumed": len(details),
+            "matches": []
+        })
+
+    respx.post("https://api.apollo.io/api/v1/people/bulk_match").mock(side_effect=bulk_match)
+
+    client = ApolloClient(api_key="test_api_key")
+    details = [{"id": f"p{i}"} for i in range(25)]
+    result = await client.people_bulk_enrichment_many(BulkPeopleEnrichmentQuery(details=details))
+
+    assert result is not None
+    assert result.total_requested_enrichments == 25
+    assert result.missing_records == 10
+    assert result.credits_consumed == 15
+
+
+@respx.mock
+async def test_people_enrichment_batched_unit():
+    """Test that concurrent batched enrichments share one bulk_match request."""
+    route = respx.post("https://api.apollo.io/api/v1/people/bulk_match").mock(
+        return_value=Response(200, json={"status": "success", "matches": [None, None, None]})
+    )
+
+    client = ApolloClient(api_key="test_api_key")
+    queries = [PeopleEnrichmentQuery(email=f"person{i}@example.com") for i in range(3)]
+    results = await asyncio.gather(*(client.batcher.people_enrichment(q) for q in queries))
+
+    assert route.call_count == 1
+    details = json.loads(route.calls.last.request.content)["details"]
+    assert details == [{"email": f"person{i}@example.com"} for i in range(3)]
+    assert all(result is not None and result.person is None for result in results)
+
+
+@pytest.mark.parametrize("bulk_failure", [Response(422, text="Invalid detail"), httpx.ConnectError("connection reset")])
+@respx.mock
+async def test_people_enrichment_batched_failure_unit(bulk_failure):
+    """Test that a failed bulk_match falls back per person, so one bad query doesn't fail the batch."""
+    respx.post("https://api.apollo.io/api/v1/people/bulk_match").mock(side_effect=[bulk_failure])
+
+    def match(request):
+        email = json.loads(request.content)["email"]
+        if email == "person1@example.com":
+            return Response(422, text="Invalid email")
+        if email == "person2@example.com":
+            raise httpx.ConnectError("connection reset")
+        return Response(200, json={"person": None})
+
+    route = respx.post("https://api.apollo.io/api/v1/people/match").mock(side_effect=match)
+
+    client = ApolloClient(api_key="test_api_key")
+    queries = [PeopleEnrichmentQuery(email=f"person{i}@example.com") for i in range(4)]
+    results = await asyncio.gather(
+        *(client.batcher.people_enrichment(q) for q in queries),
+        return_exceptions=True
+    )
+
+    assert route.call_count == 4
+    assert results[0] is not None and results[0].person is None
+    assert results[1] is None
+    assert isinstance(results[2], httpx.ConnectError)
+    assert results[3] is not None and results[3].person is None
@@ -3,11 +3,6 @@ Apollo.io MCP Server Tools
 
 Modular tool organization for the Apollo.io MCP server.
 Each module contains related tools and registers them with the MCP instance.
+Modules are imported on demand by server.register_tools_from_set, so only the
+categories that have enabled tools are loaded.
 """
-from . import people
-from . import organizations
-from . import contacts
-from . import accounts
-from . import misc
-
-__all__ = ['people', 'organizations', 'contacts', 'accounts', 'misc']
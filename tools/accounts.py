@@ -1,19 +1,28 @@
 """
 Account CRUD and list management tools for Apollo.io MCP server.
 """
+from __future__ import annotations
+
 from typing import Optional, List
+from pydantic import TypeAdapter
+from apollo import AccountBulkItem
+from tools.utils import AccountListResult, compact, dump_result
+
+# Built once at import and reused to validate every bulk create payload
+_ACCOUNT_BULK_ADAPTER = TypeAdapter(List[AccountBulkItem])
 
 
 def register_tools(mcp, apollo_client):
     """Register all account-related tools with the MCP server."""
 
     @mcp.tool()
+    @dump_result
     async def account_search(
         query: Optional[str] = None,
         label_ids: Optional[List[str]] = None,
         page: int = 1,
         per_page: int = 25
-    ) -> Optional[dict]:
+    ) -> Optional[str]:
         """
         Search accounts saved to YOUR CRM (not global search). Returns account_id for updates.
         Use organization_search for prospecting.
@@ -27,15 +36,15 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/search-for-accounts
         """
-        result = await apollo_client.account_search(
+        return await apollo_client.account_search(
             query=query,
             label_ids=label_ids,
             page=page,
             per_page=per_page
         )
-        return result.model_dump() if result else None
     
     @mcp.tool()
+    @dump_result
     async def account_create(
         name: str,
         domain: Optional[str] = None,
@@ -44,7 +53,7 @@ def register_tools(mcp, apollo_client):
         phone: Optional[str] = None,
         raw_address: Optional[str] = None,
         label_names: Optional[List[str]] = None
-    ) -> Optional[dict]:
+    ) -> Optional[str]:
         """
         Create new account in Apollo CRM. Master API key required.
 
@@ -66,7 +75,7 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/create-an-account
         """
-        result = await apollo_client.account_create(
+        return await apollo_client.account_create(
             name=name,
             domain=domain,
             owner_id=owner_id,
@@ -75,9 +84,9 @@ def register_tools(mcp, apollo_client):
             raw_address=raw_address,
             label_names=label_names
         )
-        return result.model_dump() if result else None
     
     @mcp.tool()
+    @dump_result
     async def account_update(
         account_id: str,
         name: Optional[str] = None,
@@ -87,7 +96,7 @@ def register_tools(mcp, apollo_client):
         phone: Optional[str] = None,
         raw_address: Optional[str] = None,
         label_names: Optional[List[str]] = None
-    ) -> Optional[dict]:
+    ) -> Optional[str]:
         """
         Update existing account in Apollo CRM. Master API key required.
 
@@ -111,27 +120,21 @@ def register_tools(mcp, apollo_client):
             https://docs.apollo.io/reference/update-an-account
         """
         # Build fields dict with only non-None values
-        fields = {}
-        if name is not None:
-            fields["name"] = name
-        if domain is not None:
-            fields["domain"] = domain
-        if owner_id is not None:
-            fields["owner_id"] = owner_id
-        if account_stage_id is not None:
-            fields["account_stage_id"] = account_stage_id
-        if phone is not None:
-            fields["phone"] = phone
-        if raw_address is not None:
-            fields["raw_address"] = raw_address
-        if label_names is not None:
-            fields["label_names"] = label_names
+        fields = compact(
+            name=name,
+            domain=domain,
+            owner_id=owner_id,
+            account_stage_id=account_stage_id,
+            phone=phone,
+            raw_address=raw_address,
+            label_names=label_names
+        )
     
-        result = await apollo_client.account_update(account_id=account_id, **fields)
-        return result.model_dump() if result else None
+        return await apollo_client.account_update(account_id=account_id, **fields)
     
     @mcp.tool()
-    async def account_bulk_create(accounts: List[dict]) -> Optional[dict]:
+    @dump_result
+    async def account_bulk_create(accounts: List[dict]) -> Optional[str]:
         """
         Bulk create up to 100 accounts. Master API key required.
 
@@ -150,11 +153,14 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/bulk-create-accounts
         """
-        result = await apollo_client.account_bulk_create(accounts=accounts)
-        return result.model_dump() if result else None
+        # Fail fast on records missing required fields (name); the original
+        # dicts are forwarded so extra fields still reach the API
+        _ACCOUNT_BULK_ADAPTER.validate_python(accounts)
+        return await apollo_client.account_bulk_create(accounts=accounts)
     
     @mcp.tool()
-    async def account_bulk_update(accounts: List[dict]) -> Optional[dict]:
+    @dump_result
+    async def account_bulk_update(accounts: List[dict]) -> Optional[str]:
         """
         Bulk update up to 100 accounts. Master API key required.
 
@@ -172,14 +178,13 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/bulk-update-accounts
         """
-        result = await apollo_client.account_bulk_update(accounts=accounts)
-        return result.model_dump() if result else None
+        return await apollo_client.account_bulk_update(accounts=accounts)
     
     @mcp.tool()
     async def account_add_to_list(
         account_ids: List[str],
         label_name: str
-    ) -> Optional[dict]:
+    ) -> Optional[AccountListResult]:
         """
         Add accounts to a list without losing existing labels (max 10). Master API key required.
 
@@ -205,7 +210,7 @@ def register_tools(mcp, apollo_client):
     async def account_remove_from_list(
         account_ids: List[str],
         label_name: str
-    ) -> Optional[dict]:
+    ) -> Optional[AccountListResult]:
         """
         Remove accounts from a list without affecting other labels (max 10). Master API key required.
 
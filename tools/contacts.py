@@ -1,19 +1,28 @@
 """
 Contact CRUD operations tools for Apollo.io MCP server.
 """
+from __future__ import annotations
+
 from typing import Optional, List
+from pydantic import TypeAdapter
+from apollo import ContactBulkItem
+from tools.utils import ContactListResult, compact, dump_result, phone_numbers
+
+# Built once at import and reused to validate every bulk create payload
+_CONTACT_BULK_ADAPTER = TypeAdapter(List[ContactBulkItem])
 
 
 def register_tools(mcp, apollo_client):
     """Register all contact-related tools with the MCP server."""
 
     @mcp.tool()
+    @dump_result
     async def contact_search(
         query: Optional[str] = None,
         label_ids: Optional[List[str]] = None,
         page: int = 1,
         per_page: int = 25
-    ) -> Optional[dict]:
+    ) -> Optional[str]:
         """
         Search contacts saved to YOUR CRM (not global search). Returns contact_id for updates.
         Use people_search for prospecting.
@@ -24,15 +33,15 @@ def register_tools(mcp, apollo_client):
             page: Page number (default: 1)
             per_page: Results per page (default: 25, max: 100)
         """
-        result = await apollo_client.contact_search(
+        return await apollo_client.contact_search(
             query=query,
             label_ids=label_ids,
             page=page,
             per_page=per_page
         )
-        return result.model_dump() if result else None
     
     @mcp.tool()
+    @dump_result
     async def contact_create(
         first_name: str,
         last_name: str,
@@ -45,7 +54,7 @@ def register_tools(mcp, apollo_client):
         state: Optional[str] = None,
         country: Optional[str] = None,
         linkedin_url: Optional[str] = None
-    ) -> Optional[dict]:
+    ) -> Optional[str]:
         """
         Create new contact in Apollo CRM and optionally add to lists.
 
@@ -68,27 +77,22 @@ def register_tools(mcp, apollo_client):
         Returns:
             Dict with created contact including contact_id, or None on error
         """
-        # Convert phone_number string to phone_numbers list if provided
-        phone_numbers = None
-        if phone_number:
-            phone_numbers = [{"raw_number": phone_number, "type": "mobile"}]
-    
-        result = await apollo_client.contact_create(
+        return await apollo_client.contact_create(
             first_name=first_name,
             last_name=last_name,
             email=email,
             organization_name=organization_name,
             title=title,
             label_names=label_names,
-            phone_numbers=phone_numbers,
+            phone_numbers=phone_numbers(phone_number or None),
             city=city,
             state=state,
             country=country,
             linkedin_url=linkedin_url
         )
-        return result.model_dump() if result else None
     
     @mcp.tool()
+    @dump_result
     async def contact_update(
         contact_id: str,
         first_name: Optional[str] = None,
@@ -102,7 +106,7 @@ def register_tools(mcp, apollo_client):
         state: Optional[str] = None,
         country: Optional[str] = None,
         linkedin_url: Optional[str] = None
-    ) -> Optional[dict]:
+    ) -> Optional[str]:
         """
         Update existing contact in Apollo CRM.
 
@@ -127,36 +131,25 @@ def register_tools(mcp, apollo_client):
             Dict with updated contact, or None on error
         """
         # Build fields dict with only non-None values
-        fields = {}
-        if first_name is not None:
-            fields["first_name"] = first_name
-        if last_name is not None:
-            fields["last_name"] = last_name
-        if email is not None:
-            fields["email"] = email
-        if organization_name is not None:
-            fields["organization_name"] = organization_name
-        if title is not None:
-            fields["title"] = title
-        if label_names is not None:
-            fields["label_names"] = label_names
-        if phone_number is not None:
-            # Convert phone_number string to phone_numbers list
-            fields["phone_numbers"] = [{"raw_number": phone_number, "type": "mobile"}]
-        if city is not None:
-            fields["city"] = city
-        if state is not None:
-            fields["state"] = state
-        if country is not None:
-            fields["country"] = country
-        if linkedin_url is not None:
-            fields["linkedin_url"] = linkedin_url
+        fields = compact(
+            first_name=first_name,
+            last_name=last_name,
+            email=email,
+            organization_name=organization_name,
+            title=title,
+            label_names=label_names,
+            city=city,
+            state=state,
+            country=country,
+            linkedin_url=linkedin_url,
+            phone_numbers=phone_numbers(phone_number)
+        )
     
-        result = await apollo_client.contact_update(contact_id=contact_id, **fields)
-        return result.model_dump() if result else None
+        return await apollo_client.contact_update(contact_id=contact_id, **fields)
     
     @mcp.tool()
-    async def contact_bulk_create(contacts: List[dict]) -> Optional[dict]:
+    @dump_result
+    async def contact_bulk_create(contacts: List[dict]) -> Optional[str]:
         """
         Bulk create up to 100 contacts.
 
@@ -176,11 +169,14 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/create-contacts-bulk
         """
-        result = await apollo_client.contact_bulk_create(contacts=contacts)
-        return result.model_dump() if result else None
+        # Fail fast on records missing required fields (first_name/last_name); the original
+        # dicts are forwarded so extra fields still reach the API
+        _CONTACT_BULK_ADAPTER.validate_python(contacts)
+        return await apollo_client.contact_bulk_create(contacts=contacts)
     
     @mcp.tool()
-    async def contact_bulk_update(contacts: List[dict]) -> Optional[dict]:
+    @dump_result
+    async def contact_bulk_update(contacts: List[dict]) -> Optional[str]:
         """
         Bulk update up to 100 contacts.
 
@@ -198,14 +194,13 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/update-contacts-bulk
         """
-        result = await apollo_client.contact_bulk_update(contacts=contacts)
-        return result.model_dump() if result else None
+        return await apollo_client.contact_bulk_update(contacts=contacts)
 
     @mcp.tool()
     async def contact_add_to_list(
         contact_ids: List[str],
         label_name: str
-    ) -> Optional[dict]:
+    ) -> Optional[ContactListResult]:
         """
         Add contacts to a list without losing existing labels (max 10). Master API key required.
 
@@ -229,7 +224,7 @@ def register_tools(mcp, apollo_client):
     async def contact_remove_from_list(
         contact_ids: List[str],
         label_name: str
-    ) -> Optional[dict]:
+    ) -> Optional[ContactListResult]:
         """
         Remove contacts from a list without affecting other labels (max 10). Master API key required.
 
@@ -1,14 +1,18 @@
 """
 Miscellaneous tools (usage stats and labels) for Apollo.io MCP server.
 """
+from __future__ import annotations
+
 from typing import Optional
+from tools.utils import dump_result
 
 
 def register_tools(mcp, apollo_client):
     """Register miscellaneous tools with the MCP server."""
 
     @mcp.tool()
-    async def usage_stats() -> Optional[dict]:
+    @dump_result
+    async def usage_stats() -> Optional[str]:
         """
         Get API usage and rate limits per endpoint. Master API key required.
         Shows minute/hour/day limits with consumed and left_over counts.
@@ -16,11 +20,12 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/get-usage-stats
         """
-        result = await apollo_client.usage_stats()
-        return result.model_dump() if result else None
+        # The stats model passes every endpoint key through, so skip building it
+        return await apollo_client.usage_stats(raw=True)
     
     @mcp.tool()
-    async def labels_list(modality: Optional[str] = None) -> Optional[dict]:
+    @dump_result
+    async def labels_list(modality: Optional[str] = None) -> Optional[str]:
         """
         List all labels/lists in your Apollo account. Master API key required.
 
@@ -33,5 +38,4 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/get-a-list-of-all-lists
         """
-        result = await apollo_client.labels_list(modality=modality)
-        return result.model_dump() if result else None
+        return await apollo_client.labels_list(modality=modality)
@@ -1,15 +1,19 @@
 """
 Organization search, enrichment, and job posting tools for Apollo.io MCP server.
 """
+from __future__ import annotations
+
 from typing import Optional
 from apollo import OrganizationEnrichmentQuery, OrganizationSearchQuery
+from tools.utils import dump_result
 
 
 def register_tools(mcp, apollo_client):
     """Register all organization-related tools with the MCP server."""
 
     @mcp.tool()
-    async def organization_enrichment(query: OrganizationEnrichmentQuery) -> Optional[dict]:
+    @dump_result
+    async def organization_enrichment(query: OrganizationEnrichmentQuery) -> Optional[str]:
         """
         Enrich company data by domain. Returns comprehensive company info from Apollo's
         global database. Does not consume credits.
@@ -23,11 +27,11 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/organization-enrichment
         """
-        result = await apollo_client.organization_enrichment(query)
-        return result.model_dump() if result else None
+        return await apollo_client.organization_enrichment(query)
 
     @mcp.tool()
-    async def organization_search(query: OrganizationSearchQuery) -> Optional[dict]:
+    @dump_result
+    async def organization_search(query: OrganizationSearchQuery) -> Optional[str]:
         """
         Search 73M+ companies by size, revenue, location, technology, keywords.
         Does not consume credits. Returns organization_id for enrichment/people_search.
@@ -40,11 +44,11 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/organization-search
         """
-        result = await apollo_client.organization_search(query)
-        return result.model_dump() if result else None
+        return await apollo_client.organization_search(query)
 
     @mcp.tool()
-    async def organization_job_postings(organization_id: str) -> Optional[dict]:
+    @dump_result
+    async def organization_job_postings(organization_id: str) -> Optional[str]:
         """
         Get active job postings for a company. Identifies hiring signals and growth areas.
         Does not consume credits.
@@ -58,5 +62,4 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/organization-jobs-postings
         """
-        result = await apollo_client.organization_job_postings(organization_id)
-        return result.model_dump() if result else None
+        return await apollo_client.organization_job_postings(organization_id)
@@ -1,15 +1,19 @@
 """
 People search and enrichment tools for Apollo.io MCP server.
 """
+from __future__ import annotations
+
 from typing import Optional
 from apollo import PeopleEnrichmentQuery, BulkPeopleEnrichmentQuery, PeopleSearchQuery
+from tools.utils import dump_result
 
 
 def register_tools(mcp, apollo_client):
     """Register all people-related tools with the MCP server."""
 
     @mcp.tool()
-    async def people_enrichment(query: PeopleEnrichmentQuery) -> Optional[dict]:
+    @dump_result
+    async def people_enrichment(query: PeopleEnrichmentQuery) -> Optional[str]:
         """
         Enrich person data by email, LinkedIn URL, name, or person_id.
         Returns employment history, contact info, and engagement signals.
@@ -21,11 +25,12 @@ def register_tools(mcp, apollo_client):
 
         https://docs.apollo.io/reference/people-enrichment
         """
-        result = await apollo_client.people_enrichment(query)
-        return result.model_dump() if result else None
+        # Concurrent calls are coalesced into one bulk enrichment request
+        return await apollo_client.batcher.people_enrichment(query)
 
     @mcp.tool()
-    async def people_bulk_enrichment(query: BulkPeopleEnrichmentQuery) -> Optional[dict]:
+    @dump_result
+    async def people_bulk_enrichment(query: BulkPeopleEnrichmentQuery) -> Optional[str]:
         """
         Enrich up to 10 people in one request. More efficient than individual calls.
 
@@ -37,11 +42,29 @@ def register_tools(mcp, apollo_client):
 
         https://docs.apollo.io/reference/bulk-people-enrichment
         """
-        result = await apollo_client.people_bulk_enrichment(query)
-        return result.model_dump() if result else None
+        return await apollo_client.people_bulk_enrichment(query)
+
+    @mcp.tool()
+    @dump_result
+    async def people_mega_enrichment(query: BulkPeopleEnrichmentQuery) -> Optional[str]:
+        """
+        Enrich any number of people. Details are split into batches of 10 and
+        sent to bulk enrichment concurrently, then merged into one result.
+
+        Same parameters and credit usage as people_bulk_enrichment, without the
+        10-person limit. Counts and credits_consumed are totals across batches;
+        matches are de-duplicated by person id.
+
+        Returns: {status, total_requested_enrichments, unique_enriched_records,
+        missing_records, credits_consumed, matches}
+
+        https://docs.apollo.io/reference/bulk-people-enrichment
+        """
+        return await apollo_client.people_bulk_enrichment_many(query)
 
     @mcp.tool()
-    async def people_search(query: PeopleSearchQuery) -> Optional[dict]:
+    @dump_result
+    async def people_search(query: PeopleSearchQuery) -> Optional[str]:
         """
         Search 275M+ people by title, seniority, location, company, and more.
         Does not consume credits. Returns person_id for enrichment.
@@ -54,5 +77,4 @@ def register_tools(mcp, apollo_client):
         Reference:
             https://docs.apollo.io/reference/people-search
         """
-        result = await apollo_client.people_search(query)
-        return result.model_dump() if result else None
+        return await apollo_client.people_search(query)
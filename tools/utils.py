@@ -0,0 +1,67 @@
+"""
+Shared helpers for Apollo.io MCP server tools.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypedDict, Union
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class ContactListResult(TypedDict):
+    """Result of contact_add_to_list / contact_remove_from_list."""
+    updated_contacts: List[Dict[str, Any]]
+    found_ids: List[str]
+    not_found_ids: List[str]
+    total_requested: int
+
+
+class AccountListResult(TypedDict):
+    """Result of account_add_to_list / account_remove_from_list."""
+    updated_accounts: List[Dict[str, Any]]
+    found_ids: List[str]
+    not_found_ids: List[str]
+    total_requested: int
+
+
+def dump_result(fn: Callable[..., Awaitable[Optional[Union[BaseModel, Dict[str, Any]]]]]) -> Callable[..., Awaitable[Optional[str]]]:
+    """
+    Decorate a tool coroutine so the Apollo response model (or raw response
+    dict) it returns is serialized to JSON text.
+
+    None fields are dropped: Apollo responses are mostly nullable fields, so this
+    roughly halves the payload. FastMCP passes str results through as text
+    content, so the model is encoded once by pydantic-core without building an
+    intermediate dict.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Optional[str]:
+        result = await fn(*args, **kwargs)
+        # Encoded inline rather than via asyncio.to_thread: pydantic-core holds the
+        # GIL while serializing, so a worker thread would not let the event loop
+        # run in the meantime and would only add a thread hop per call
+        if not result:
+            return None
+        if isinstance(result, BaseModel):
+            return result.model_dump_json(exclude_none=True)
+        return to_json(result).decode()
+
+    # FastMCP resolves string annotations against the wrapper's globals (this
+    # module), so hand it the tool's signature with annotations already evaluated
+    wrapper.__signature__ = inspect.signature(fn, eval_str=True)
+    return wrapper
+
+
+def compact(**fields: Any) -> Dict[str, Any]:
+    """Return only the keyword arguments that were provided (not None)."""
+    return {k: v for k, v in fields.items() if v is not None}
+
+
+def phone_numbers(raw_number: Optional[str]) -> Optional[List[Dict[str, str]]]:
+    """Convert a single phone string into Apollo's phone_numbers list."""
+    if raw_number is None:
+        return None
+    return [{"raw_number": raw_number, "type": "mobile"}]